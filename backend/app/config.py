@@ -27,6 +27,9 @@ class Settings(BaseSettings):
     # EVM 配置
     EVM_RPC_URL: str = os.getenv("EVM_RPC_URL", "")
     POLKADOT_RPC_URL: str = os.getenv("POLKADOT_RPC_URL", "")
+    # 可选的WebSocket地址，配置后监听器启用 eth_subscribe 推送模式
+    EVM_WS_URL: str = os.getenv("EVM_WS_URL", "")
+    POLKADOT_WS_URL: str = os.getenv("POLKADOT_WS_URL", "")
     NFT_CONTRACT_ADDRESS: str = os.getenv("NFT_CONTRACT_ADDRESS", "")
     POLKADOT_NFT_CONTRACT_ADDRESS: str = os.getenv("POLKADOT_NFT_CONTRACT_ADDRESS", "")
     LAUNCHPAD_CONTRACT_ADDRESS: str = os.getenv("LAUNCHPAD_CONTRACT_ADDRESS", "")
@@ -34,6 +37,122 @@ class Settings(BaseSettings):
         "POLKADOT_LAUNCHPAD_CONTRACT_ADDRESS", ""
     )
     PRIVATE_KEY: str = os.getenv("PRIVATE_KEY", "")
+    # 异步RPC连接池配置
+    RPC_POOL_SIZE: int = int(os.getenv("RPC_POOL_SIZE", "20"))
+    RPC_TIMEOUT_SECONDS: int = int(os.getenv("RPC_TIMEOUT_SECONDS", "30"))
+
+    # RPC节点池配置（逗号分隔的多个节点，留空则只使用 *_RPC_URL）
+    EVM_RPC_URLS: str = os.getenv("EVM_RPC_URLS", "")
+    POLKADOT_RPC_URLS: str = os.getenv("POLKADOT_RPC_URLS", "")
+    RPC_EJECT_SECONDS: float = float(os.getenv("RPC_EJECT_SECONDS", "5"))
+    RPC_BROADCAST_COUNT: int = int(os.getenv("RPC_BROADCAST_COUNT", "3"))
+
+    # ABI注册表的pickle缓存路径（留空则不使用缓存）
+    CONTRACT_ABI_CACHE: str = os.getenv("CONTRACT_ABI_CACHE", "")
+
+    # 死信队列重试配置
+    DLQ_POLL_SECONDS: float = float(os.getenv("DLQ_POLL_SECONDS", "10"))
+    DLQ_BATCH_SIZE: int = int(os.getenv("DLQ_BATCH_SIZE", "50"))
+    DLQ_RETRY_CONCURRENCY: int = int(os.getenv("DLQ_RETRY_CONCURRENCY", "4"))
+    DLQ_BASE_DELAY_SECONDS: float = float(os.getenv("DLQ_BASE_DELAY_SECONDS", "30"))
+    DLQ_MAX_DELAY_SECONDS: float = float(os.getenv("DLQ_MAX_DELAY_SECONDS", "3600"))
+    DLQ_MAX_ATTEMPTS: int = int(os.getenv("DLQ_MAX_ATTEMPTS", "10"))
+    # 是否在API进程内运行事件同步（默认由 python -m app.worker 独立运行）
+    RUN_INGEST_IN_API: bool = os.getenv("RUN_INGEST_IN_API", "false").lower() == "true"
+    # worker 的 Prometheus 指标端口（0 表示不启动）
+    WORKER_METRICS_PORT: int = int(os.getenv("WORKER_METRICS_PORT", "9100"))
+
+    # 多副本部署时的领导者选举（基于 MySQL GET_LOCK，每条链只有一个进程同步）
+    LEADER_ELECTION_ENABLED: bool = (
+        os.getenv("LEADER_ELECTION_ENABLED", "true").lower() == "true"
+    )
+    LEADER_LEASE_SECONDS: int = int(os.getenv("LEADER_LEASE_SECONDS", "30"))
+    LEADER_HEARTBEAT_SECONDS: float = float(
+        os.getenv("LEADER_HEARTBEAT_SECONDS", "5")
+    )
+    LEADER_RETRY_SECONDS: float = float(os.getenv("LEADER_RETRY_SECONDS", "5"))
+
+    # 估价API连接池配置
+    PRICING_POOL_SIZE: int = int(os.getenv("PRICING_POOL_SIZE", "50"))
+    PRICING_TIMEOUT_SECONDS: float = float(os.getenv("PRICING_TIMEOUT_SECONDS", "30"))
+    PRICING_KEEPALIVE_SECONDS: float = float(
+        os.getenv("PRICING_KEEPALIVE_SECONDS", "60")
+    )
+
+    # 估价缓存配置（估价模型变更时修改版本号使旧缓存失效）
+    PRICING_MODEL_VERSION: str = os.getenv("PRICING_MODEL_VERSION", "v1")
+    # 批量估价接口，留空则逐条调用
+    PRICING_BATCH_URL: str = os.getenv("PRICING_BATCH_URL", "")
+    # 批量接口连续返回错误或格式不符达到该次数后停用批量估价
+    PRICING_BATCH_MAX_FAILURES: int = int(
+        os.getenv("PRICING_BATCH_MAX_FAILURES", "3")
+    )
+    PRICING_BATCH_WINDOW_MS: float = float(os.getenv("PRICING_BATCH_WINDOW_MS", "5"))
+    PRICING_BATCH_MAX_ITEMS: int = int(os.getenv("PRICING_BATCH_MAX_ITEMS", "32"))
+    PRICE_CACHE_MAX_ITEMS: int = int(os.getenv("PRICE_CACHE_MAX_ITEMS", "10000"))
+    PRICE_CACHE_MEMORY_TTL_SECONDS: float = float(
+        os.getenv("PRICE_CACHE_MEMORY_TTL_SECONDS", "3600")
+    )
+    PRICE_CACHE_DB_TTL_SECONDS: float = float(
+        os.getenv("PRICE_CACHE_DB_TTL_SECONDS", "604800")
+    )
+
+    # 管理员钱包地址（逗号分隔），用于访问管理接口
+    ADMIN_ADDRESSES: str = os.getenv("ADMIN_ADDRESSES", "")
+
+    # 交易提交与回执跟踪配置
+    TX_RECEIPT_POLL_SECONDS: float = float(os.getenv("TX_RECEIPT_POLL_SECONDS", "1.0"))
+    TX_RECEIPT_BATCH_SIZE: int = int(os.getenv("TX_RECEIPT_BATCH_SIZE", "50"))
+    TX_RECEIPT_TIMEOUT_SECONDS: float = float(
+        os.getenv("TX_RECEIPT_TIMEOUT_SECONDS", "120")
+    )
+
+    # 批量定价配置
+    PRICE_BATCH_WINDOW_SECONDS: float = float(
+        os.getenv("PRICE_BATCH_WINDOW_SECONDS", "0.5")
+    )
+    PRICE_BATCH_MAX_ITEMS: int = int(os.getenv("PRICE_BATCH_MAX_ITEMS", "50"))
+    BATCH_SET_PRICE_BASE_GAS: int = int(os.getenv("BATCH_SET_PRICE_BASE_GAS", "60000"))
+    BATCH_SET_PRICE_GAS_PER_ITEM: int = int(
+        os.getenv("BATCH_SET_PRICE_GAS_PER_ITEM", "60000")
+    )
+
+    # 手续费预言机配置
+    FEE_ORACLE_TTL_SECONDS: float = float(os.getenv("FEE_ORACLE_TTL_SECONDS", "10"))
+    FEE_HISTORY_BLOCKS: int = int(os.getenv("FEE_HISTORY_BLOCKS", "20"))
+    FEE_REWARD_PERCENTILE: float = float(os.getenv("FEE_REWARD_PERCENTILE", "50"))
+    FEE_BASE_FEE_MULTIPLIER: float = float(os.getenv("FEE_BASE_FEE_MULTIPLIER", "2"))
+    MAX_FEE_PER_GAS_GWEI: float = float(os.getenv("MAX_FEE_PER_GAS_GWEI", "1000"))
+
+    # 热钱包余额账本配置
+    WALLET_LOW_BALANCE_ETH: float = float(os.getenv("WALLET_LOW_BALANCE_ETH", "0.05"))
+    WALLET_RECONCILE_SECONDS: float = float(
+        os.getenv("WALLET_RECONCILE_SECONDS", "60")
+    )
+
+    # 事件回填配置
+    BACKFILL_INITIAL_WINDOW: int = int(os.getenv("BACKFILL_INITIAL_WINDOW", "2000"))
+    BACKFILL_MIN_WINDOW: int = int(os.getenv("BACKFILL_MIN_WINDOW", "1"))
+    BACKFILL_MAX_WINDOW: int = int(os.getenv("BACKFILL_MAX_WINDOW", "10000"))
+    BACKFILL_CONCURRENCY: int = int(os.getenv("BACKFILL_CONCURRENCY", "4"))
+    BACKFILL_FAST_WINDOW_SECONDS: float = float(
+        os.getenv("BACKFILL_FAST_WINDOW_SECONDS", "2.0")
+    )
+    # 各链轮询间隔与确认数
+    EVM_POLL_INTERVAL_SECONDS: float = float(
+        os.getenv("EVM_POLL_INTERVAL_SECONDS", "60")
+    )
+    EVM_CONFIRMATIONS: int = int(os.getenv("EVM_CONFIRMATIONS", "0"))
+    POLKADOT_POLL_INTERVAL_SECONDS: float = float(
+        os.getenv("POLKADOT_POLL_INTERVAL_SECONDS", "60")
+    )
+    POLKADOT_CONFIRMATIONS: int = int(os.getenv("POLKADOT_CONFIRMATIONS", "0"))
+    # 单轮处理区块数超过该阈值时进入追赶模式（不等待轮询间隔）
+    CATCHUP_THRESHOLD_BLOCKS: int = int(os.getenv("CATCHUP_THRESHOLD_BLOCKS", "100"))
+
+    # 铸造处理流水线配置
+    MINT_WORKERS: int = int(os.getenv("MINT_WORKERS", "8"))
+    MINT_QUEUE_SIZE: int = int(os.getenv("MINT_QUEUE_SIZE", "200"))
 
     # AI评估配置
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
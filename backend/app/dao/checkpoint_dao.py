@@ -0,0 +1,44 @@
+from sqlalchemy.orm import Session
+from app.models import ChainCheckpointDB
+from typing import List, Optional
+
+
+class CheckpointDAO:
+    @staticmethod
+    def get_last_block(
+        db: Session, chain: str, contract_addresses: List[str]
+    ) -> Optional[int]:
+        """获取链上一组合约的最小已处理区块，任一合约缺少检查点时返回None"""
+        checkpoints = (
+            db.query(ChainCheckpointDB)
+            .filter(
+                ChainCheckpointDB.chain == chain,
+                ChainCheckpointDB.contract_address.in_(contract_addresses),
+            )
+            .all()
+        )
+        if len(checkpoints) < len(set(contract_addresses)):
+            return None
+        return min(checkpoint.last_block for checkpoint in checkpoints)
+
+    @staticmethod
+    def save(
+        db: Session,
+        chain: str,
+        contract_address: str,
+        last_block: int,
+        commit: bool = True,
+    ) -> ChainCheckpointDB:
+        """写入或更新检查点"""
+        checkpoint = db.merge(
+            ChainCheckpointDB(
+                chain=chain,
+                contract_address=contract_address,
+                last_block=last_block,
+            )
+        )
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+        return checkpoint
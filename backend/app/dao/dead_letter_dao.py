@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from app.models import DeadLetterEventDB
+from typing import List, Optional
+
+# 死信状态
+PENDING = "pending"
+RESOLVED = "resolved"
+EXHAUSTED = "exhausted"
+
+
+class DeadLetterDAO:
+    @staticmethod
+    def add(
+        db: Session,
+        chain: str,
+        tx_hash: str,
+        log_index: int,
+        block_number: int,
+        event_name: str,
+        payload: str,
+        error: str,
+        next_retry_at: datetime,
+        commit: bool = True,
+    ) -> DeadLetterEventDB:
+        """
+        写入失败事件；同一事件已在队列中时更新错误信息并重新置为待重试
+        """
+        entry = (
+            db.query(DeadLetterEventDB)
+            .filter(
+                DeadLetterEventDB.chain == chain,
+                DeadLetterEventDB.tx_hash == tx_hash,
+                DeadLetterEventDB.log_index == log_index,
+            )
+            .first()
+        )
+        if entry is None:
+            entry = DeadLetterEventDB(
+                chain=chain,
+                tx_hash=tx_hash,
+                log_index=log_index,
+                block_number=block_number,
+                event_name=event_name,
+                attempts=0,
+            )
+            db.add(entry)
+
+        entry.payload = payload
+        entry.error = error
+        entry.status = PENDING
+        entry.next_retry_at = next_retry_at
+        if commit:
+            db.commit()
+            db.refresh(entry)
+        else:
+            db.flush()
+        return entry
+
+    @staticmethod
+    def get_by_id(db: Session, entry_id: int) -> Optional[DeadLetterEventDB]:
+        return (
+            db.query(DeadLetterEventDB)
+            .filter(DeadLetterEventDB.id == entry_id)
+            .first()
+        )
+
+    @staticmethod
+    def get_due(
+        db: Session, chain: str, now: datetime, limit: int = 50
+    ) -> List[DeadLetterEventDB]:
+        """获取已到重试时间的待重试事件"""
+        return (
+            db.query(DeadLetterEventDB)
+            .filter(
+                DeadLetterEventDB.chain == chain,
+                DeadLetterEventDB.status == PENDING,
+                DeadLetterEventDB.next_retry_at <= now,
+            )
+            .order_by(DeadLetterEventDB.next_retry_at)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def get_list(
+        db: Session,
+        chain: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[DeadLetterEventDB]:
+        query = db.query(DeadLetterEventDB)
+        if chain:
+            query = query.filter(DeadLetterEventDB.chain == chain)
+        if status:
+            query = query.filter(DeadLetterEventDB.status == status)
+        return (
+            query.order_by(DeadLetterEventDB.id.desc()).offset(offset).limit(limit).all()
+        )
+
+    @staticmethod
+    def mark_resolved(db: Session, entry: DeadLetterEventDB, commit: bool = True):
+        """重试成功"""
+        entry.status = RESOLVED
+        entry.attempts += 1
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+
+    @staticmethod
+    def record_failure(
+        db: Session,
+        entry: DeadLetterEventDB,
+        error: str,
+        base_delay: float,
+        max_delay: float,
+        max_attempts: int,
+    ):
+        """重试失败：按指数退避安排下次重试，超过最大次数后不再自动重试"""
+        entry.attempts += 1
+        entry.error = error
+        if entry.attempts >= max_attempts:
+            entry.status = EXHAUSTED
+        else:
+            delay = min(base_delay * 2 ** (entry.attempts - 1), max_delay)
+            entry.next_retry_at = datetime.utcnow() + timedelta(seconds=delay)
+        db.commit()
+
+    @staticmethod
+    def schedule_replay(db: Session, entry: DeadLetterEventDB) -> DeadLetterEventDB:
+        """手动重放：立即重新置为待重试"""
+        entry.status = PENDING
+        entry.next_retry_at = datetime.utcnow()
+        db.commit()
+        db.refresh(entry)
+        return entry
@@ -6,12 +6,15 @@ from typing import List, Optional, Dict, Any
 
 class NFTDAO:
     @staticmethod
-    def create(db: Session, nft_data: Dict[str, Any]) -> NFTDB:
+    def create(db: Session, nft_data: Dict[str, Any], commit: bool = True) -> NFTDB:
         """创建新NFT"""
         db_nft = NFTDB(**nft_data)
         db.add(db_nft)
-        db.commit()
-        db.refresh(db_nft)
+        if commit:
+            db.commit()
+            db.refresh(db_nft)
+        else:
+            db.flush()
         return db_nft
 
     @staticmethod
@@ -36,14 +39,17 @@ class NFTDAO:
         return db.query(NFTDB).order_by(desc(NFTDB.current_price)).limit(limit).all()
 
     @staticmethod
-    def update_owner(db: Session, token_id: int, new_owner: str) -> bool:
+    def update_owner(
+        db: Session, token_id: int, new_owner: str, commit: bool = True
+    ) -> bool:
         """更新NFT所有者"""
         result = (
             db.query(NFTDB)
             .filter(NFTDB.token_id == token_id)
             .update({"owner_address": new_owner})
         )
-        db.commit()
+        if commit:
+            db.commit()
         return result > 0
 
     @staticmethod
@@ -58,12 +64,15 @@ class NFTDAO:
         return result > 0
 
     @staticmethod
-    def update_current_price(db: Session, token_id: int, price: float) -> bool:
+    def update_current_price(
+        db: Session, token_id: int, price: float, commit: bool = True
+    ) -> bool:
         """更新NFT当前价格"""
         result = (
             db.query(NFTDB)
             .filter(NFTDB.token_id == token_id)
             .update({"current_price": price})
         )
-        db.commit()
+        if commit:
+            db.commit()
         return result > 0
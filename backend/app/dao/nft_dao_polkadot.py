@@ -6,12 +6,17 @@ from typing import List, Optional, Dict, Any
 
 class NFTPolkadotDAO:
     @staticmethod
-    def create(db: Session, nft_data: Dict[str, Any]) -> NFTPolkadotDB:
+    def create(
+        db: Session, nft_data: Dict[str, Any], commit: bool = True
+    ) -> NFTPolkadotDB:
         """创建新Polkadot链上NFT"""
         db_nft = NFTPolkadotDB(**nft_data)
         db.add(db_nft)
-        db.commit()
-        db.refresh(db_nft)
+        if commit:
+            db.commit()
+            db.refresh(db_nft)
+        else:
+            db.flush()
         return db_nft
 
     @staticmethod
@@ -45,14 +50,17 @@ class NFTPolkadotDAO:
         )
 
     @staticmethod
-    def update_owner(db: Session, token_id: int, new_owner: str) -> bool:
+    def update_owner(
+        db: Session, token_id: int, new_owner: str, commit: bool = True
+    ) -> bool:
         """更新NFT所有者"""
         result = (
             db.query(NFTPolkadotDB)
             .filter(NFTPolkadotDB.token_id == token_id)
             .update({"owner_address": new_owner})
         )
-        db.commit()
+        if commit:
+            db.commit()
         return result > 0
 
     @staticmethod
@@ -67,12 +75,15 @@ class NFTPolkadotDAO:
         return result > 0
 
     @staticmethod
-    def update_current_price(db: Session, token_id: int, price: float) -> bool:
+    def update_current_price(
+        db: Session, token_id: int, price: float, commit: bool = True
+    ) -> bool:
         """更新NFT当前价格"""
         result = (
             db.query(NFTPolkadotDB)
             .filter(NFTPolkadotDB.token_id == token_id)
             .update({"current_price": price})
         )
-        db.commit()
+        if commit:
+            db.commit()
         return result > 0
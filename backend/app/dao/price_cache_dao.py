@@ -0,0 +1,36 @@
+from datetime import datetime
+from sqlalchemy.orm import Session
+from app.models import PriceCacheDB
+from typing import Optional
+
+
+class PriceCacheDAO:
+    @staticmethod
+    def get(
+        db: Session, content_hash: str, not_before: datetime
+    ) -> Optional[PriceCacheDB]:
+        """获取未过期的缓存估价"""
+        return (
+            db.query(PriceCacheDB)
+            .filter(
+                PriceCacheDB.content_hash == content_hash,
+                PriceCacheDB.created_at >= not_before,
+            )
+            .first()
+        )
+
+    @staticmethod
+    def save(
+        db: Session, content_hash: str, model_version: str, price: float
+    ) -> PriceCacheDB:
+        """写入或更新缓存估价"""
+        entry = db.merge(
+            PriceCacheDB(
+                content_hash=content_hash,
+                model_version=model_version,
+                price=price,
+                created_at=datetime.utcnow(),
+            )
+        )
+        db.commit()
+        return entry
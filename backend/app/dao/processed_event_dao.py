@@ -0,0 +1,48 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import tuple_
+from app.models import ProcessedEventDB
+from typing import Iterable, Set, Tuple
+
+
+class ProcessedEventDAO:
+    @staticmethod
+    def get_processed_keys(
+        db: Session, chain: str, keys: Iterable[Tuple[str, int]]
+    ) -> Set[Tuple[str, int]]:
+        """批量查询已处理的 (tx_hash, log_index)，整个窗口只需一次查询"""
+        keys = list(keys)
+        if not keys:
+            return set()
+        rows = (
+            db.query(ProcessedEventDB.tx_hash, ProcessedEventDB.log_index)
+            .filter(
+                ProcessedEventDB.chain == chain,
+                tuple_(ProcessedEventDB.tx_hash, ProcessedEventDB.log_index).in_(keys),
+            )
+            .all()
+        )
+        return {(row.tx_hash, row.log_index) for row in rows}
+
+    @staticmethod
+    def record(
+        db: Session,
+        chain: str,
+        tx_hash: str,
+        log_index: int,
+        block_number: int,
+        event_name: str,
+    ) -> ProcessedEventDB:
+        """
+        记录已处理事件（不提交，随事件的其他写入一起提交）
+        - 唯一键冲突时 flush 抛出 IntegrityError，表示事件已被处理过
+        """
+        processed_event = ProcessedEventDB(
+            chain=chain,
+            tx_hash=tx_hash,
+            log_index=log_index,
+            block_number=block_number,
+            event_name=event_name,
+        )
+        db.add(processed_event)
+        db.flush()
+        return processed_event
@@ -7,6 +7,8 @@ from sqlalchemy import (
     Text,
     DECIMAL,
     BigInteger,
+    PrimaryKeyConstraint,
+    UniqueConstraint,
 )
 from sqlalchemy.sql import func
 from pydantic import BaseModel
@@ -41,6 +43,65 @@ class NFTPolkadotDB(Base):
     updated_at = Column(DateTime, onupdate=func.now())
 
 
+# SQLAlchemy ORM 模型
+class ChainCheckpointDB(Base):
+    __tablename__ = "chain_checkpoint"
+
+    chain = Column(String(64), nullable=False)
+    contract_address = Column(String(255), nullable=False)
+    last_block = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
+
+    __table_args__ = (PrimaryKeyConstraint("chain", "contract_address"),)
+
+
+# SQLAlchemy ORM 模型
+class ProcessedEventDB(Base):
+    __tablename__ = "processed_event"
+
+    chain = Column(String(64), nullable=False)
+    tx_hash = Column(String(66), nullable=False)
+    log_index = Column(Integer, nullable=False)
+    block_number = Column(BigInteger, nullable=False)
+    event_name = Column(String(64), nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (PrimaryKeyConstraint("chain", "tx_hash", "log_index"),)
+
+
+# SQLAlchemy ORM 模型
+class PriceCacheDB(Base):
+    __tablename__ = "price_cache"
+
+    content_hash = Column(String(64), primary_key=True)
+    model_version = Column(String(32), nullable=False)
+    price = Column(DECIMAL(20, 12), nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
+
+
+# SQLAlchemy ORM 模型
+class DeadLetterEventDB(Base):
+    __tablename__ = "dead_letter_event"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    chain = Column(String(64), nullable=False)
+    tx_hash = Column(String(66), nullable=False)
+    log_index = Column(Integer, nullable=False)
+    block_number = Column(BigInteger, nullable=False)
+    event_name = Column(String(64), nullable=False)
+    payload = Column(Text, nullable=False)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    status = Column(String(16), nullable=False, default="pending", index=True)
+    next_retry_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
+
+    __table_args__ = (UniqueConstraint("chain", "tx_hash", "log_index"),)
+
+
 # Pydantic 模型
 class NFTResponse(BaseModel):
     token_id: int
@@ -95,6 +156,25 @@ class NFTPolkadotListResponse(BaseModel):
         from_attributes = True
 
 
+# 死信事件响应模型
+class DeadLetterEventResponse(BaseModel):
+    id: int
+    chain: str
+    tx_hash: str
+    log_index: int
+    block_number: int
+    event_name: str
+    error: Optional[str] = None
+    attempts: int
+    status: str
+    next_retry_at: datetime
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 # 统一的多链NFT响应模型
 class MultiChainNFTResponse(BaseModel):
     chain_type: str
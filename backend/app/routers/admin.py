@@ -0,0 +1,55 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from sqlalchemy.orm import Session
+from app.models import DeadLetterEventResponse
+from app.dao.dead_letter_dao import DeadLetterDAO
+from app.database import get_db
+from app.utils.jwt_auth import require_admin
+from typing import List, Optional
+
+
+router = APIRouter()
+
+
+@router.get("/dead-letters", response_model=List[DeadLetterEventResponse])
+def get_dead_letters(
+    chain: Optional[str] = Query(None, description="链标识"),
+    status_filter: Optional[str] = Query(
+        None, alias="status", description="状态: pending/resolved/exhausted"
+    ),
+    limit: int = Query(50, description="返回数量限制"),
+    offset: int = Query(0, description="偏移量"),
+    db: Session = Depends(get_db),
+    admin: str = Depends(require_admin),
+):
+    """获取死信事件列表"""
+    return DeadLetterDAO.get_list(db, chain, status_filter, limit, offset)
+
+
+@router.get("/dead-letters/{entry_id}", response_model=DeadLetterEventResponse)
+def get_dead_letter(
+    entry_id: int,
+    db: Session = Depends(get_db),
+    admin: str = Depends(require_admin),
+):
+    """获取死信事件详情"""
+    entry = DeadLetterDAO.get_by_id(db, entry_id)
+    if not entry:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Dead letter not found"
+        )
+    return entry
+
+
+@router.post("/dead-letters/{entry_id}/replay", response_model=DeadLetterEventResponse)
+def replay_dead_letter(
+    entry_id: int,
+    db: Session = Depends(get_db),
+    admin: str = Depends(require_admin),
+):
+    """重放死信事件：立即交由后台重试任务处理"""
+    entry = DeadLetterDAO.get_by_id(db, entry_id)
+    if not entry:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Dead letter not found"
+        )
+    return DeadLetterDAO.schedule_replay(db, entry)
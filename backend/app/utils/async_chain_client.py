@@ -0,0 +1,385 @@
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+from web3 import AsyncWeb3
+from web3.providers.rpc import AsyncHTTPProvider
+
+from app.config import settings
+from app.utils.tx_submitter import TransactionSubmitter
+from app.utils.fee_oracle import FeeOracle
+from app.utils.wallet_state import WalletState
+from app.utils.rpc_pool import RPCEndpointPool
+from app.utils.price_batcher import PriceBatcher
+from app.utils.contract_registry import contract_registry
+from app.utils.metrics import SET_PRICE_RECEIPT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncChainClient:
+    """
+    异步链客户端基类，基于 AsyncWeb3 与连接池化的 AsyncHTTPProvider。
+    - 所有RPC调用均为协程，不会阻塞 FastAPI 所在的事件循环
+    - 子类只需提供RPC地址、合约地址与网络名称；新增链也可直接传参构造
+    """
+
+    chain_label = "EVM"
+    # 链标识，与 ChainConfig.name 一致，用作指标标签
+    chain_name = "evm"
+    network_names: Dict[int, str] = {}
+
+    def __init__(
+        self,
+        rpc_url: str = "",
+        contract_address: str = "",
+        chain_label: Optional[str] = None,
+        chain_name: Optional[str] = None,
+    ):
+        self._configured = (rpc_url, contract_address)
+        if chain_label:
+            self.chain_label = chain_label
+        if chain_name:
+            self.chain_name = chain_name
+        self._w3: Optional[AsyncWeb3] = None
+        self._contract: Optional[Any] = None
+        self._chain_id: Optional[int] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.submitter: Optional[TransactionSubmitter] = None
+        self.fee_oracle: Optional[FeeOracle] = None
+        self.wallet: Optional[WalletState] = None
+        self.price_batcher = PriceBatcher(
+            self,
+            max_wait=settings.PRICE_BATCH_WINDOW_SECONDS,
+            max_items=settings.PRICE_BATCH_MAX_ITEMS,
+        )
+        self._initialized = False
+
+    def _load_config(self) -> Tuple[str, str]:
+        """
+        返回 (RPC地址, NFT合约地址)，子类可覆盖以从配置文件读取。
+        RPC地址可以是逗号分隔的多个节点
+        """
+        return self._configured
+
+    def _build_provider(self) -> Any:
+        """单个节点直接使用 AsyncHTTPProvider，多个节点使用节点池"""
+        request_kwargs = {"timeout": settings.RPC_TIMEOUT_SECONDS}
+        urls = [url.strip() for url in self.rpc_url.split(",") if url.strip()]
+        if len(urls) == 1:
+            return AsyncHTTPProvider(urls[0], request_kwargs=request_kwargs)
+        return RPCEndpointPool(
+            urls,
+            request_kwargs=request_kwargs,
+            eject_seconds=settings.RPC_EJECT_SECONDS,
+            broadcast_count=settings.RPC_BROADCAST_COUNT,
+        )
+
+    def _initialize(self):
+        """
+        初始化 AsyncWeb3 和合约实例。
+        - 从配置文件加载RPC URL、合约地址、私钥
+        - 只构建对象，不发起网络请求
+        """
+        if self._initialized:
+            return
+
+        try:
+            self.rpc_url, self.contract_address = self._load_config()
+            self.private_key = settings.PRIVATE_KEY
+
+            if not all([self.rpc_url, self.contract_address, self.private_key]):
+                raise ValueError(
+                    f"缺少必要的{self.chain_label}配置，请检查 .env 文件"
+                )
+
+            self._w3 = AsyncWeb3(self._build_provider())
+
+            self._contract = contract_registry.contract(
+                self._w3, self.chain_name, "AiTextNFT", self.contract_address
+            )
+            self.account = self._w3.eth.account.from_key(self.private_key)
+            self.submitter = TransactionSubmitter(
+                self._w3,
+                self.account,
+                poll_interval=settings.TX_RECEIPT_POLL_SECONDS,
+                batch_size=settings.TX_RECEIPT_BATCH_SIZE,
+                receipt_timeout=settings.TX_RECEIPT_TIMEOUT_SECONDS,
+            )
+            self.fee_oracle = FeeOracle(
+                self._w3,
+                ttl=settings.FEE_ORACLE_TTL_SECONDS,
+                block_count=settings.FEE_HISTORY_BLOCKS,
+                reward_percentile=settings.FEE_REWARD_PERCENTILE,
+                base_fee_multiplier=settings.FEE_BASE_FEE_MULTIPLIER,
+                max_fee_cap_wei=self._w3.to_wei(settings.MAX_FEE_PER_GAS_GWEI, "gwei"),
+            )
+            self.wallet = WalletState(
+                self._w3,
+                self.account.address,
+                low_balance_wei=self._w3.to_wei(
+                    settings.WALLET_LOW_BALANCE_ETH, "ether"
+                ),
+                reconcile_interval=settings.WALLET_RECONCILE_SECONDS,
+            )
+
+            self._initialized = True
+
+        except (ValueError, FileNotFoundError, json.JSONDecodeError) as e:
+            self._w3 = None
+            self._contract = None
+            self._initialized = False
+            print(f"{self.chain_label}异步客户端初始化失败: {e}")
+            raise
+
+    async def connect(self):
+        """
+        建立连接池并校验节点连通性。
+        - 为 provider 注入带连接上限与 keep-alive 的共享 aiohttp 会话
+        """
+        self._initialize()
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=settings.RPC_POOL_SIZE,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            await self._w3.provider.cache_async_session(self._session)
+
+        if not await self._w3.is_connected():
+            raise ConnectionError(f"无法连接到RPC: {self.rpc_url}")
+
+        self._chain_id = await self._w3.eth.chain_id
+        print(f"{self.chain_label}异步客户端初始化成功")
+
+    async def aclose(self):
+        """关闭连接池"""
+        if self.fee_oracle:
+            self.fee_oracle.stop()
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @property
+    def w3(self) -> AsyncWeb3:
+        """获取AsyncWeb3实例，如果未初始化则先进行初始化"""
+        if not self._initialized:
+            self._initialize()
+        return self._w3
+
+    @property
+    def contract(self) -> Any:
+        """获取合约实例，如果未初始化则先进行初始化"""
+        if not self._initialized:
+            self._initialize()
+        return self._contract
+
+    async def get_chain_id(self) -> int:
+        """获取链ID（首次调用后缓存）"""
+        if self._chain_id is None:
+            self._chain_id = await self.w3.eth.chain_id
+        return self._chain_id
+
+    async def batch_call(
+        self, *calls: Callable[[AsyncWeb3], Awaitable[Any]]
+    ) -> List[Any]:
+        """
+        将多个互不依赖的RPC调用打包为一个 JSON-RPC 批量请求，一次往返取回全部结果。
+        - 每个调用以 `lambda w3: w3.eth.xxx(...)` 的形式传入，按顺序返回结果
+        - 节点不支持批量请求时退回为逐个调用
+        """
+        try:
+            async with self.w3.batch_requests() as batch:
+                for call in calls:
+                    batch.add(call(self.w3))
+                return list(await batch.async_execute())
+        except Exception as e:
+            logger.debug(f"{self.chain_label} batch request failed, falling back: {e}")
+            return [await call(self.w3) for call in calls]
+
+    async def _prime_transaction_state(self):
+        """
+        用一次批量请求补齐交易构建所需的链上状态（链ID、手续费、余额、nonce），
+        只请求缓存缺失或过期的部分；只缺一项时交由各组件自行获取
+        """
+        address = self.account.address
+        oracle = self.fee_oracle
+        nonces = self.submitter.nonces
+        calls: Dict[str, Callable[[AsyncWeb3], Awaitable[Any]]] = {}
+
+        if self._chain_id is None:
+            calls["chain_id"] = lambda w3: w3.eth.chain_id
+        if oracle.is_stale:
+            calls["fee_history"] = lambda w3: w3.eth.fee_history(
+                oracle.block_count, "latest", [oracle.reward_percentile]
+            )
+            calls["gas_price"] = lambda w3: w3.eth.gas_price
+        if self.wallet.needs_balance:
+            calls["balance"] = lambda w3: w3.eth.get_balance(address)
+        if not nonces.synced:
+            calls["nonce"] = lambda w3: w3.eth.get_transaction_count(address, "pending")
+
+        if len(calls) < 2:
+            return
+
+        results = dict(zip(calls, await self.batch_call(*calls.values())))
+        if "chain_id" in results:
+            self._chain_id = results["chain_id"]
+        if "fee_history" in results:
+            oracle.update(results["fee_history"], results["gas_price"])
+        if "balance" in results:
+            self.wallet.set_balance(results["balance"])
+        if "nonce" in results and not nonces.synced:
+            nonces.set(results["nonce"])
+
+    async def _get_fee_fields(self) -> Dict[str, int]:
+        """获取交易手续费字段（来自手续费预言机缓存），失败时回退为固定gasPrice"""
+        try:
+            return await self.fee_oracle.get_fees()
+        except Exception:
+            return {"gasPrice": self.w3.to_wei("50", "gwei")}
+
+    async def _send_contract_transaction(
+        self, contract_call: Any, gas: int
+    ) -> Dict[str, Any]:
+        """
+        构建、签名并提交合约调用交易
+        - 交易经共享提交器连续发送，nonce 由提交器分配
+        - 余额由本地钱包账本预留与结算，不在每笔交易前查询链上余额
+        - 缺失的链ID、手续费、余额、nonce 以一次批量RPC请求补齐
+        - 回执由后台跟踪任务批量轮询，等待时不阻塞事件循环
+        """
+        try:
+            if not self._initialized:
+                self._initialize()
+
+            account = self.account
+            try:
+                await self._prime_transaction_state()
+            except Exception as e:
+                logger.debug(f"{self.chain_label} state priming failed: {e}")
+            fee_fields = await self._get_fee_fields()
+
+            # 按最高花费在本地账本中预留余额
+            estimated_cost = gas * FeeOracle.max_fee_per_gas(fee_fields)
+            if not await self.wallet.reserve(estimated_cost):
+                return {
+                    "success": False,
+                    "error": f"余额不足，需要 {self.w3.from_wei(estimated_cost, 'ether')} ETH",
+                }
+
+            try:
+                # 构建交易（nonce 由提交器在发送时分配，此处仅占位以避免额外RPC）
+                transaction = await contract_call.build_transaction(
+                    {
+                        "from": account.address,
+                        "gas": gas,
+                        **fee_fields,
+                        "nonce": 0,
+                        "chainId": await self.get_chain_id(),
+                    }
+                )
+
+                # 签名并发送交易，等待后台跟踪任务返回回执
+                started = time.monotonic()
+                tx_hash, receipt = await self.submitter.submit(transaction)
+                # 只统计确实取得回执的交易，发送失败或超时不计入
+                SET_PRICE_RECEIPT_SECONDS.labels(self.chain_name).observe(
+                    time.monotonic() - started
+                )
+            except Exception:
+                self.wallet.release(estimated_cost)
+                raise
+
+            self.wallet.settle(estimated_cost, receipt)
+
+            if receipt.status == 0:
+                return {
+                    "success": False,
+                    "error": "交易执行失败",
+                    "transaction_hash": tx_hash.hex(),
+                }
+
+            return {
+                "success": True,
+                "transaction_hash": tx_hash.hex(),
+                "gas_used": receipt.gasUsed,
+            }
+
+        except Exception as e:
+            error_msg = str(e)
+            if "insufficient funds" in error_msg.lower():
+                return {"success": False, "error": "账户余额不足"}
+            elif "nonce too low" in error_msg.lower():
+                return {"success": False, "error": "交易nonce过低，请重试"}
+            else:
+                return {"success": False, "error": f"设置价格失败: {error_msg}"}
+
+    async def set_nft_price(self, token_id: int, price_wei: int) -> Dict[str, Any]:
+        """
+        设置NFT价格
+        - 调用合约的setPrice方法
+        - 返回交易结果
+        """
+        result = await self._send_contract_transaction(
+            self.contract.functions.setPrice(token_id, price_wei), gas=100000
+        )
+        if result["success"]:
+            result.update(
+                {
+                    "token_id": token_id,
+                    "price_wei": price_wei,
+                    "price_eth": float(self.w3.from_wei(price_wei, "ether")),
+                }
+            )
+        return result
+
+    async def batch_set_nft_prices(
+        self, token_ids: List[int], prices_wei: List[int]
+    ) -> Dict[str, Any]:
+        """
+        批量设置NFT价格
+        - 调用合约的batchSetPrice方法，一笔交易设置多个token的价格
+        """
+        gas = settings.BATCH_SET_PRICE_BASE_GAS + (
+            settings.BATCH_SET_PRICE_GAS_PER_ITEM * len(token_ids)
+        )
+        return await self._send_contract_transaction(
+            self.contract.functions.batchSetPrice(token_ids, prices_wei), gas=gas
+        )
+
+    async def is_connected(self) -> bool:
+        """检查是否成功连接到节点"""
+        try:
+            return self._w3 is not None and await self._w3.is_connected()
+        except Exception:
+            return False
+
+    async def get_network_info(self) -> Dict[str, Any]:
+        """
+        获取当前连接的网络信息。
+        - 链ID、网络名称、最新区块号、Gas价格
+        """
+        if not await self.is_connected():
+            return {"success": False, "error": f"未连接到{self.chain_label}网络"}
+
+        try:
+            chain_id, latest_block, gas_price = await self.batch_call(
+                lambda w3: w3.eth.chain_id,
+                lambda w3: w3.eth.block_number,
+                lambda w3: w3.eth.gas_price,
+            )
+            self._chain_id = chain_id
+            return {
+                "success": True,
+                "chain_id": chain_id,
+                "network_name": self.network_names.get(chain_id, "Unknown"),
+                "latest_block": latest_block,
+                "gas_price_gwei": float(self.w3.from_wei(gas_price, "gwei")),
+            }
+        except Exception as e:
+            return {"success": False, "error": f"获取网络信息失败: {str(e)}"}
@@ -0,0 +1,189 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# RPC 节点拒绝过大区间时常见的错误信息片段
+RANGE_ERROR_MARKERS = (
+    "range too large",
+    "block range",
+    "too many blocks",
+    "more than 10000 results",
+    "query returned more than",
+    "response size exceeded",
+    "limit exceeded",
+    "exceed maximum block range",
+    "query timeout",
+    "timed out",
+)
+
+# 超时一类的错误：可能只是网络抖动，只缩小窗口，不作为窗口大小上限的依据
+TIMEOUT_ERROR_MARKERS = ("query timeout", "timed out")
+
+FetchWindow = Callable[[int, int], Awaitable[List[Any]]]
+ApplyWindow = Callable[[int, int, List[Any]], Awaitable[None]]
+
+
+def is_range_error(error: Exception) -> bool:
+    """判断异常是否为“查询区间过大”一类的错误"""
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in RANGE_ERROR_MARKERS)
+
+
+def is_timeout_error(error: Exception) -> bool:
+    """判断异常是否为超时（而非节点明确拒绝区间）"""
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in TIMEOUT_ERROR_MARKERS)
+
+
+class BlockRangeBackfiller:
+    """
+    分块并发的 eth_getLogs 回填引擎。
+    - 将 [from_block, to_block] 切分为自适应大小的窗口
+    - 遇到区间过大错误时缩小窗口并拆分重试，窗口返回较快时逐步放大
+    - 被节点明确拒绝（非超时）的窗口大小作为放大上限，放大时逐步逼近而不再越过，窗口大小最终收敛
+    - 连续 recover_after_windows 个窗口都较快返回时上限放宽 1/4，适应节点限制或日志密度的变化
+    - 以并发上限同时拉取多个窗口，但严格按区块顺序应用结果
+    - 已拉取但尚未应用的窗口数有上限，队首窗口阻塞时暂停推进游标，避免日志堆积在内存中
+    """
+
+    def __init__(
+        self,
+        fetch_window: FetchWindow,
+        initial_window: int = 2000,
+        min_window: int = 1,
+        max_window: int = 10000,
+        concurrency: int = 4,
+        fast_window_seconds: float = 2.0,
+        ready_windows_per_worker: int = 4,
+        recover_after_windows: int = 100,
+    ):
+        self.fetch_window = fetch_window
+        self.window_size = max(min_window, min(initial_window, max_window))
+        self.min_window = min_window
+        self.max_window = max_window
+        self.concurrency = max(1, concurrency)
+        self.fast_window_seconds = fast_window_seconds
+        self.max_ready = self.concurrency * max(1, ready_windows_per_worker)
+        # 已知可能被拒绝的最小窗口大小减一，窗口放大不超过该值
+        self.ceiling = max_window
+        self.recover_after_windows = max(1, recover_after_windows)
+        self._fast_streak = 0
+
+    def _shrink(self, failed_size: int, error: Exception):
+        self._fast_streak = 0
+        if not is_timeout_error(error):
+            self.ceiling = max(self.min_window, min(self.ceiling, failed_size - 1))
+        self.window_size = max(
+            self.min_window, min(self.window_size, failed_size // 2)
+        )
+
+    def _grow(self, elapsed: float, size: int):
+        if elapsed >= self.fast_window_seconds:
+            self._fast_streak = 0
+            return
+        self._fast_streak += 1
+        if (
+            self.ceiling < self.max_window
+            and self._fast_streak >= self.recover_after_windows
+        ):
+            self.ceiling = min(
+                self.max_window, self.ceiling + max(1, self.ceiling // 4)
+            )
+            self._fast_streak = 0
+        if size < self.window_size:
+            return
+        if self.ceiling < self.max_window:
+            # 接近曾被拒绝的大小时每次只走剩余距离的一半
+            target = (self.window_size + self.ceiling + 1) // 2
+        else:
+            target = self.window_size * 2
+        self.window_size = min(self.ceiling, target)
+
+    async def _timed_fetch(self, start: int, end: int) -> Tuple[List[Any], float]:
+        started = time.monotonic()
+        logs = await self.fetch_window(start, end)
+        return logs, time.monotonic() - started
+
+    async def run(
+        self, from_block: int, to_block: int, apply_window: ApplyWindow
+    ) -> int:
+        """
+        回填 [from_block, to_block] 区间内的日志。
+
+        Args:
+            from_block: 起始区块（包含）
+            to_block: 结束区块（包含）
+            apply_window: 按区块顺序应用每个窗口结果的回调
+
+        Returns:
+            最后一个已应用的区块号
+        """
+        if to_block < from_block:
+            return from_block - 1
+
+        cursor = from_block
+        next_apply = from_block
+        retry: List[Tuple[int, int]] = []
+        ready: Dict[int, Tuple[int, List[Any]]] = {}
+        in_flight: Dict[asyncio.Task, Tuple[int, int]] = {}
+
+        try:
+            while next_apply <= to_block:
+                # 优先调度被拆分的失败窗口，其次沿游标推进新窗口
+                while len(in_flight) < self.concurrency:
+                    if retry:
+                        start, end = heapq.heappop(retry)
+                    elif cursor <= to_block and len(ready) < self.max_ready:
+                        start = cursor
+                        end = min(cursor + self.window_size - 1, to_block)
+                        cursor = end + 1
+                    else:
+                        break
+                    task = asyncio.create_task(self._timed_fetch(start, end))
+                    in_flight[task] = (start, end)
+
+                done, _ = await asyncio.wait(
+                    in_flight.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    start, end = in_flight.pop(task)
+                    size = end - start + 1
+                    try:
+                        logs, elapsed = task.result()
+                    except Exception as e:
+                        if not is_range_error(e) or size <= self.min_window:
+                            raise
+                        self._shrink(size, e)
+                        mid = start + size // 2 - 1
+                        heapq.heappush(retry, (start, mid))
+                        heapq.heappush(retry, (mid + 1, end))
+                        logger.warning(
+                            f"Window {start}-{end} rejected "
+                            f"({type(e).__name__}: {e}), "
+                            f"shrinking to {self.window_size} blocks"
+                        )
+                        continue
+
+                    self._grow(elapsed, size)
+                    ready[start] = (end, logs)
+
+                # 只应用连续就绪的窗口，保证区块顺序
+                while next_apply in ready:
+                    end, logs = ready.pop(next_apply)
+                    await apply_window(next_apply, end, logs)
+                    next_apply = end + 1
+
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        return next_apply - 1
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Any, List
+
+from app.config import settings
+from app.dao.nft_dao import NFTDAO
+from app.dao.nft_dao_polkadot import NFTPolkadotDAO
+from app.utils.async_chain_client import AsyncChainClient
+from app.utils.evm_client import async_evm_client
+from app.utils.polkadot_client import async_polkadot_client
+
+
+@dataclass
+class ChainConfig:
+    """
+    单条链的事件同步配置。
+    - name: 链标识，用于检查点与日志
+    - client: 该链的异步客户端（RPC地址与NFT合约地址由客户端持有）
+    - dao: 该链NFT表对应的DAO
+    """
+
+    name: str
+    client: AsyncChainClient
+    launchpad_contract_address: str
+    dao: Any
+    ws_url: str = ""
+    poll_interval: float = 60
+    confirmations: int = 0
+
+
+def load_chain_configs() -> List[ChainConfig]:
+    """
+    返回所有已配置的链。
+    新增一条EVM链时只需在此追加一项配置（及其NFT表/DAO），无需复制监听器模块。
+    """
+    return [
+        ChainConfig(
+            name=async_evm_client.chain_name,
+            client=async_evm_client,
+            launchpad_contract_address=settings.LAUNCHPAD_CONTRACT_ADDRESS,
+            dao=NFTDAO,
+            ws_url=settings.EVM_WS_URL,
+            poll_interval=settings.EVM_POLL_INTERVAL_SECONDS,
+            confirmations=settings.EVM_CONFIRMATIONS,
+        ),
+        ChainConfig(
+            name=async_polkadot_client.chain_name,
+            client=async_polkadot_client,
+            launchpad_contract_address=settings.POLKADOT_LAUNCHPAD_CONTRACT_ADDRESS,
+            dao=NFTPolkadotDAO,
+            ws_url=settings.POLKADOT_WS_URL,
+            poll_interval=settings.POLKADOT_POLL_INTERVAL_SECONDS,
+            confirmations=settings.POLKADOT_CONFIRMATIONS,
+        ),
+    ]
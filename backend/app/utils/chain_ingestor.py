@@ -0,0 +1,752 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Mapping, Optional, Set, Tuple
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, WebSocketProvider
+from web3.contract import AsyncContract
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dao.checkpoint_dao import CheckpointDAO
+from app.dao.processed_event_dao import ProcessedEventDAO
+from app.dao.dead_letter_dao import DeadLetterDAO, PENDING
+from app.utils.chain_config import ChainConfig, load_chain_configs
+from app.utils.evaluate import calculate_price
+from app.utils.backfill import BlockRangeBackfiller
+from app.utils.mint_pipeline import MintPipeline
+from app.utils.log_decoder import get_log_decoder_registry
+from app.utils.contract_registry import contract_registry
+from app.utils.leader_election import LeaderLease
+from app.utils.metrics import (
+    CHAIN_HEAD_BLOCK,
+    CHAIN_LAG_BLOCKS,
+    CHAIN_PROCESSED_BLOCK,
+    DB_WRITE_SECONDS,
+    EVENTS_PROCESSED,
+    EXCEPTIONS,
+    GET_LOGS_SECONDS,
+    PRICING_SECONDS,
+)
+from app.config import settings
+
+# 配置日志
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ChainIngestor:
+    """
+    与链无关的事件同步器，行为完全由 ChainConfig 决定。
+    - 拉取 Minted/Bought 事件并写入该链的NFT表
+    - 通过检查点恢复进度，支持WebSocket推送唤醒
+    """
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.chain_name = config.name
+        self.client = config.client
+        self.dao = config.dao
+        self.w3: Optional[AsyncWeb3] = None
+        self.nft_contract: Optional[AsyncContract] = None
+        self.launchpad_contract: Optional[AsyncContract] = None
+        self.is_running = False
+        self.last_processed_block = 0
+        self.catching_up = False
+        # WebSocket 推送模式：配置了WS地址时启用，收到新区块/日志即唤醒处理循环
+        self.ws_url = config.ws_url
+        self.new_block_event = asyncio.Event()
+        self.subscription_task: Optional[asyncio.Task] = None
+        # 死信重试任务：失败事件写入死信表，由后台按指数退避重试
+        self.dead_letter_task: Optional[asyncio.Task] = None
+        # 提交后发出的链上定价，等待回执并回写当前价格的后台任务
+        self.price_tasks: Set[asyncio.Task] = set()
+        # (合约地址, topic0) -> (事件名, 事件解码器)
+        self.event_decoders: Dict[tuple, tuple] = {}
+        self.backfiller = BlockRangeBackfiller(
+            self._fetch_window,
+            initial_window=settings.BACKFILL_INITIAL_WINDOW,
+            min_window=settings.BACKFILL_MIN_WINDOW,
+            max_window=settings.BACKFILL_MAX_WINDOW,
+            concurrency=settings.BACKFILL_CONCURRENCY,
+            fast_window_seconds=settings.BACKFILL_FAST_WINDOW_SECONDS,
+        )
+        self.mint_pipeline = MintPipeline(
+            self.chain_name,
+            workers=settings.MINT_WORKERS,
+            queue_size=settings.MINT_QUEUE_SIZE,
+        )
+
+    async def initialize(self):
+        """初始化事件监听器"""
+        try:
+            await self.client.connect()
+            self.w3 = self.client.w3
+            self.nft_contract = self.client.contract
+
+            # 初始化AiLaunchpad合约
+            self.launchpad_contract = contract_registry.contract(
+                self.w3,
+                self.chain_name,
+                "AiLaunchpad",
+                self.config.launchpad_contract_address,
+            )
+
+            if not self.w3 or not self.nft_contract or not self.launchpad_contract:
+                raise Exception("Failed to initialize Web3 or contracts")
+
+            self._build_event_decoders()
+
+            # 从检查点恢复；首次启动时以当前区块号作为起始点
+            self.last_processed_block = await self._load_checkpoint()
+            logger.info(
+                f"{self.chain_name} ingestor initialized at block "
+                f"{self.last_processed_block}"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to initialize {self.chain_name} ingestor: {e}")
+            raise
+
+    def _build_event_decoders(self):
+        """
+        预先构建关注事件的topic到解码器的映射
+        - 使用预编译的快速解码器直接切片原始日志，不经过 web3 的事件处理
+        """
+        registry = get_log_decoder_registry()
+        self.event_decoders = {}
+        for contract, contract_name, event_name in (
+            (self.nft_contract, "AiTextNFT", "Minted"),
+            (self.launchpad_contract, "AiLaunchpad", "Bought"),
+        ):
+            topic = contract_registry.event_topic(contract_name, event_name)
+            self.event_decoders[(contract.address.lower(), topic)] = (
+                event_name,
+                registry.get(topic) or contract.events[event_name](),
+            )
+
+    def _checkpoint_contracts(self):
+        """检查点对应的合约地址"""
+        return [self.nft_contract.address, self.launchpad_contract.address]
+
+    async def _load_checkpoint(self) -> int:
+        """读取已持久化的检查点，不存在时写入当前区块号"""
+        db = next(get_db())
+        try:
+            last_block = CheckpointDAO.get_last_block(
+                db, self.chain_name, self._checkpoint_contracts()
+            )
+            if last_block is not None:
+                logger.info(
+                    f"Resuming {self.chain_name} from checkpoint {last_block}"
+                )
+                return last_block
+
+            last_block = await self.w3.eth.block_number
+            for contract_address in self._checkpoint_contracts():
+                CheckpointDAO.save(db, self.chain_name, contract_address, last_block)
+            return last_block
+        finally:
+            db.close()
+
+    async def start_listening(self):
+        """开始监听事件"""
+        if not self.w3 or not self.nft_contract or not self.launchpad_contract:
+            await self.initialize()
+
+        self.is_running = True
+        logger.info(f"Starting {self.chain_name} ingestor...")
+
+        if self.ws_url and not self.subscription_task:
+            self.subscription_task = asyncio.create_task(self._run_subscription())
+        if not self.dead_letter_task:
+            self.dead_letter_task = asyncio.create_task(self._run_dead_letter_retries())
+
+        while self.is_running:
+            try:
+                self.new_block_event.clear()
+                await self._process_new_blocks()
+                if self.catching_up:
+                    continue  # 追赶模式下不等待，立即处理下一段区块
+                # 最多等待一个轮询周期再检查新区块
+                await self._wait_for_new_blocks(self.config.poll_interval)
+            except Exception as e:
+                EXCEPTIONS.labels("ingest_loop").inc()
+                logger.error(f"Error in {self.chain_name} ingestor: {e}")
+                await asyncio.sleep(10)  # 出错时等待10秒再重试
+
+    def stop_listening(self):
+        """停止监听事件"""
+        self.is_running = False
+        if self.subscription_task:
+            self.subscription_task.cancel()
+            self.subscription_task = None
+        if self.dead_letter_task:
+            self.dead_letter_task.cancel()
+            self.dead_letter_task = None
+        self.mint_pipeline.stop()
+        logger.info(f"{self.chain_name} ingestor stopped")
+
+    async def _wait_for_new_blocks(self, timeout: float):
+        """等待WebSocket推送唤醒，超时后回退为普通轮询"""
+        try:
+            await asyncio.wait_for(self.new_block_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run_subscription(self):
+        """
+        通过 eth_subscribe 订阅新区块头与关注的日志
+        - 每条推送只负责唤醒处理循环，事件仍按检查点区间拉取，保证不遗漏
+        - 连接断开时自动重连（指数退避），期间由轮询路径兜底
+        """
+        backoff = 1
+        while self.is_running:
+            try:
+                async with AsyncWeb3(WebSocketProvider(self.ws_url)) as ws_w3:
+                    await ws_w3.eth.subscribe("newHeads")
+                    await ws_w3.eth.subscribe(
+                        "logs",
+                        {
+                            "address": [
+                                self.nft_contract.address,
+                                self.launchpad_contract.address,
+                            ],
+                            "topics": [
+                                ["0x" + topic.hex() for _, topic in self.event_decoders]
+                            ],
+                        },
+                    )
+                    logger.info(f"Subscribed to {self.chain_name} via WebSocket")
+                    backoff = 1
+
+                    async for _ in ws_w3.socket.process_subscriptions():
+                        self.new_block_event.set()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                EXCEPTIONS.labels("ws_subscription").inc()
+                logger.warning(
+                    f"WebSocket subscription dropped ({e}), falling back to polling"
+                )
+
+            if self.is_running:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+
+    async def _process_new_blocks(self):
+        """处理新区块中的事件"""
+        self.catching_up = False
+        try:
+            # 只处理已达到确认数的区块
+            head_block = await self.w3.eth.block_number
+            CHAIN_HEAD_BLOCK.labels(self.chain_name).set(head_block)
+            current_block = head_block - self.config.confirmations
+
+            if current_block <= self.last_processed_block:
+                return
+
+            # 处理从上次处理的区块到当前区块的所有事件
+            from_block = self.last_processed_block + 1
+            to_block = current_block
+
+            logger.info(
+                f"Processing {self.chain_name} blocks {from_block} to {to_block}"
+            )
+
+            # 分块并发拉取，按区块顺序应用
+            await self.backfiller.run(from_block, to_block, self._apply_window)
+            CHAIN_LAG_BLOCKS.labels(self.chain_name).set(
+                head_block - self.last_processed_block
+            )
+
+            # 积压较多时进入追赶模式，直到追上链头
+            self.catching_up = (
+                to_block - from_block + 1 > settings.CATCHUP_THRESHOLD_BLOCKS
+            )
+
+        except Exception as e:
+            EXCEPTIONS.labels("process_blocks").inc()
+            logger.error(f"Error processing new blocks: {e}")
+
+    async def _fetch_window(self, from_block: int, to_block: int):
+        """
+        获取窗口内的Minted与Bought事件
+        - 一次 eth_getLogs 同时过滤两个合约地址和全部关注的topic
+        - 每条日志只解码一次，并按 (区块号, 日志序号) 排序
+        """
+        with GET_LOGS_SECONDS.labels(self.chain_name).time():
+            logs = await self.w3.eth.get_logs(
+                {
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "address": [
+                        self.nft_contract.address,
+                        self.launchpad_contract.address,
+                    ],
+                    "topics": [list({topic for _, topic in self.event_decoders})],
+                }
+            )
+
+        events = []
+        for log in sorted(logs, key=lambda log: (log["blockNumber"], log["logIndex"])):
+            if not log["topics"]:
+                continue
+            decoder = self.event_decoders.get(
+                (log["address"].lower(), bytes(log["topics"][0]))
+            )
+            if decoder is None:
+                continue
+            event_name, event = decoder
+            events.append((event_name, event.process_log(log)))
+        return events
+
+    async def _apply_window(self, from_block: int, to_block: int, events):
+        """
+        应用单个窗口内的事件，并推进已处理区块
+        - Minted 事件的估价提交到铸造流水线并发执行，全部完成后才开始写事务
+        - 数据库写入按 (区块号, 日志序号) 顺序进行，并与检查点更新在同一个事务中提交
+        - 已处理事件台账以 (链, 交易哈希, 日志序号) 去重，重放区间不会重复生效
+        - 链上定价在台账提交之后才发出，窗口重放不会重复发送交易，写事务也不等待回执
+        - 单个事件失败只回滚该事件的保存点，并写入死信表等待重试
+        """
+        db = next(get_db())
+        try:
+            # 整个窗口只查询一次台账，跳过已处理的事件
+            processed = ProcessedEventDAO.get_processed_keys(
+                db, self.chain_name, (self._event_key(event) for _, event in events)
+            )
+            # 结束只读事务，等待估价期间不占用数据库事务
+            db.commit()
+
+            prepared = []
+            for event_name, event in events:
+                if self._event_key(event) in processed:
+                    continue
+                future = None
+                if event_name == "Minted":
+                    future = await self._submit_minted_event(event)
+                prepared.append((event_name, event, future))
+            await asyncio.gather(
+                *(future for _, _, future in prepared if future is not None),
+                return_exceptions=True,
+            )
+
+            to_price: List[Tuple[int, Dict[str, Any]]] = []
+            for event_name, event, future in prepared:
+                savepoint = db.begin_nested()
+                try:
+                    if event_name == "Minted":
+                        priced = await self._handle_minted_event(db, event, future)
+                    else:
+                        await self._handle_bought_event(db, event)
+                    self._record_event(db, event_name, event)
+                    savepoint.commit()
+                    EVENTS_PROCESSED.labels(self.chain_name, event_name).inc()
+                    if event_name == "Minted":
+                        to_price.append((event["args"]["tokenId"], priced))
+                except IntegrityError:
+                    # 其他worker或并发回填已处理过该事件
+                    savepoint.rollback()
+                    logger.info(f"{event_name} event {self._event_key(event)} skipped")
+                except Exception as e:
+                    savepoint.rollback()
+                    EXCEPTIONS.labels("event_handler").inc()
+                    logger.error(f"Error handling {event_name} event: {e}")
+                    # 死信写入失败会使整个窗口回滚并重新拉取，事件不会丢失
+                    self._dead_letter(db, event_name, event, e)
+
+            with DB_WRITE_SECONDS.labels(self.chain_name, "commit").time():
+                for contract_address in self._checkpoint_contracts():
+                    CheckpointDAO.save(
+                        db, self.chain_name, contract_address, to_block, commit=False
+                    )
+                db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        for token_id, priced in to_price:
+            self._set_price_after_commit(token_id, priced)
+
+        self.last_processed_block = to_block
+        CHAIN_PROCESSED_BLOCK.labels(self.chain_name).set(to_block)
+
+    @staticmethod
+    def _event_key(event):
+        """事件的唯一键 (交易哈希, 日志序号)"""
+        return "0x" + bytes(event["transactionHash"]).hex(), event["logIndex"]
+
+    def _record_event(self, db: Session, event_name: str, event):
+        """在事件所在的事务中写入已处理台账"""
+        tx_hash, log_index = self._event_key(event)
+        ProcessedEventDAO.record(
+            db,
+            self.chain_name,
+            tx_hash,
+            log_index,
+            event["blockNumber"],
+            event_name,
+        )
+
+    @staticmethod
+    def _serialize_event(event) -> str:
+        """将解码后的事件序列化为JSON，bytes字段转为0x前缀的十六进制"""
+
+        def to_json(value):
+            if isinstance(value, Mapping):
+                return dict(value)
+            return "0x" + bytes(value).hex()
+
+        return json.dumps(event, default=to_json, ensure_ascii=False)
+
+    @staticmethod
+    def _deserialize_event(payload: str) -> Dict[str, Any]:
+        event = json.loads(payload)
+        for field in ("transactionHash", "blockHash"):
+            if field in event:
+                event[field] = HexBytes(event[field])
+        return event
+
+    def _dead_letter(self, db: Session, event_name: str, event, error: Exception):
+        """在窗口事务中写入死信表"""
+        tx_hash, log_index = self._event_key(event)
+        DeadLetterDAO.add(
+            db,
+            self.chain_name,
+            tx_hash,
+            log_index,
+            event["blockNumber"],
+            event_name,
+            self._serialize_event(event),
+            str(error),
+            datetime.utcnow() + timedelta(seconds=settings.DLQ_BASE_DELAY_SECONDS),
+            commit=False,
+        )
+
+    async def _run_dead_letter_retries(self):
+        """定期重试到期的死信事件"""
+        while self.is_running:
+            try:
+                await self._retry_dead_letters()
+            except Exception as e:
+                EXCEPTIONS.labels("dead_letter").inc()
+                logger.error(f"Error retrying {self.chain_name} dead letters: {e}")
+            await asyncio.sleep(settings.DLQ_POLL_SECONDS)
+
+    async def _retry_dead_letters(self):
+        db = next(get_db())
+        try:
+            entry_ids = [
+                entry.id
+                for entry in DeadLetterDAO.get_due(
+                    db, self.chain_name, datetime.utcnow(), settings.DLQ_BATCH_SIZE
+                )
+            ]
+        finally:
+            db.close()
+
+        if not entry_ids:
+            return
+        logger.info(f"Retrying {len(entry_ids)} {self.chain_name} dead letters")
+        semaphore = asyncio.Semaphore(settings.DLQ_RETRY_CONCURRENCY)
+        await asyncio.gather(
+            *(self._retry_dead_letter(entry_id, semaphore) for entry_id in entry_ids)
+        )
+
+    async def _retry_dead_letter(self, entry_id: int, semaphore: asyncio.Semaphore):
+        """
+        重试单个死信事件
+        - 先查询已处理台账，已处理的事件直接标记为已解决
+        - 成功时事件写入、已处理台账与死信状态在同一事务中提交
+        - 失败时按指数退避安排下次重试
+        """
+        async with semaphore:
+            db = next(get_db())
+            try:
+                entry = DeadLetterDAO.get_by_id(db, entry_id)
+                if entry is None or entry.status != PENDING:
+                    return
+                event_name = entry.event_name
+                event = self._deserialize_event(entry.payload)
+
+                # 事件已被处理过（例如区间被重放）时直接标记为已解决，不再发起链上调用
+                if ProcessedEventDAO.get_processed_keys(
+                    db, self.chain_name, [self._event_key(event)]
+                ):
+                    DeadLetterDAO.mark_resolved(db, entry, commit=False)
+                    db.commit()
+                    logger.info(
+                        f"Dead letter {entry_id} ({event_name}) already processed"
+                    )
+                    return
+
+                priced = None
+                try:
+                    if event_name == "Minted":
+                        future = await self._submit_minted_event(event)
+                        priced = await self._handle_minted_event(db, event, future)
+                    else:
+                        await self._handle_bought_event(db, event)
+                    self._record_event(db, event_name, event)
+                except IntegrityError:
+                    # 事件已被处理过（例如区间被重放），直接视为成功
+                    db.rollback()
+                    priced = None
+                    entry = DeadLetterDAO.get_by_id(db, entry_id)
+                except Exception as e:
+                    db.rollback()
+                    logger.warning(
+                        f"Dead letter {entry_id} ({event_name}) retry failed: {e}"
+                    )
+                    DeadLetterDAO.record_failure(
+                        db,
+                        DeadLetterDAO.get_by_id(db, entry_id),
+                        str(e),
+                        settings.DLQ_BASE_DELAY_SECONDS,
+                        settings.DLQ_MAX_DELAY_SECONDS,
+                        settings.DLQ_MAX_ATTEMPTS,
+                    )
+                    return
+
+                DeadLetterDAO.mark_resolved(db, entry, commit=False)
+                db.commit()
+                if priced is not None:
+                    self._set_price_after_commit(event["args"]["tokenId"], priced)
+                EVENTS_PROCESSED.labels(self.chain_name, event_name).inc()
+                logger.info(f"Dead letter {entry_id} ({event_name}) resolved")
+            finally:
+                db.close()
+
+    async def _submit_minted_event(self, event):
+        """将Minted事件的估价与定价提交到铸造流水线"""
+        token_id = event["args"]["tokenId"]
+        return await self.mint_pipeline.submit(
+            token_id, lambda: self._price_minted_event(event)
+        )
+
+    async def _price_minted_event(self, event) -> Dict[str, Any]:
+        """估价（在流水线worker中执行，不发起链上交易）"""
+        token_id = event["args"]["tokenId"]
+        content = event["args"]["content"]
+
+        # 将bytes转换为字符串
+        if isinstance(content, bytes):
+            content_text = content.decode("utf-8")
+        else:
+            content_text = str(content)
+
+        logger.info(f"Processing mint event for content: {content_text[:100]}...")
+
+        # 使用AI智能评估价格
+        with PRICING_SECONDS.labels(self.chain_name).time():
+            base_price = await calculate_price(content=content_text)
+        logger.debug(f"Evaluated token {token_id}: base price {base_price}")
+
+        # 计算NFT价格
+        gas_factor = 0.001
+        final_price_eth = base_price + gas_factor
+
+        return {
+            "content": content_text,
+            "evaluate_price": base_price,
+            "final_price": final_price_eth,
+            # 转换为wei
+            "price_wei": int(self.w3.to_wei(final_price_eth, "ether")),
+        }
+
+    async def _handle_minted_event(
+        self, db: Session, event, future
+    ) -> Dict[str, Any]:
+        """
+        处理单个Minted事件：等待流水线估价结果后写入NFT记录
+        当前价格先记为估价，链上定价成功后由 _finish_set_price 更新
+        """
+        token_id = event["args"]["tokenId"]
+        minter = event["args"]["minter"]
+        priced = await future
+
+        # 创建NFT记录
+        nft_data = {
+            "token_id": token_id,
+            "owner_address": minter,
+            "content": priced["content"],
+            "evaluate_price": priced["evaluate_price"],
+            "current_price": priced["evaluate_price"],
+        }
+        with DB_WRITE_SECONDS.labels(self.chain_name, "Minted").time():
+            self.dao.create(db, nft_data, commit=False)
+
+        logger.info(f"✅ Successfully processed Minted event for token {token_id}, ")
+        return priced
+
+    def _set_price_after_commit(self, token_id: int, priced: Dict[str, Any]):
+        """
+        在NFT记录与台账提交之后设置链上价格
+        - 加入合并队列（同一时间窗口内的定价合并为一笔交易），不等待回执
+        - 回执由后台任务等待，成功后回写当前价格
+        """
+        logger.info(f"Setting price for token {token_id}: {priced['final_price']} ETH")
+        price_future = self.client.price_batcher.enqueue(token_id, priced["price_wei"])
+        task = asyncio.create_task(
+            self._finish_set_price(token_id, priced, price_future)
+        )
+        self.price_tasks.add(task)
+        task.add_done_callback(self.price_tasks.discard)
+
+    async def _finish_set_price(
+        self, token_id: int, priced: Dict[str, Any], price_future: asyncio.Future
+    ):
+        try:
+            price_result = await price_future
+        except Exception as e:
+            price_result = {"success": False, "error": str(e)}
+
+        if not price_result["success"]:
+            EXCEPTIONS.labels("set_price").inc()
+            logger.error(
+                f"Failed to set price for token {token_id}: {price_result['error']}"
+            )
+            return
+
+        logger.info(
+            f"Successfully set price for token {token_id}: {price_result['transaction_hash']}"
+        )
+        db = next(get_db())
+        try:
+            self.dao.update_current_price(db, token_id, priced["final_price"])
+        except Exception as e:
+            EXCEPTIONS.labels("set_price").inc()
+            logger.error(f"Failed to update current price for token {token_id}: {e}")
+        finally:
+            db.close()
+
+    async def _handle_bought_event(self, db: Session, event):
+        """处理单个Bought事件"""
+        token_id = event["args"]["tokenId"]
+        buyer = event["args"]["buyer"]
+        listing_id = event["args"]["listingId"]
+
+        # 更新NFT所有者
+        with DB_WRITE_SECONDS.labels(self.chain_name, "Bought").time():
+            success = self.dao.update_owner(db, token_id, buyer, commit=False)
+
+        if not success:
+            # NFT记录尚不存在（例如其Minted事件仍在死信表中），转入死信等待重试
+            raise LookupError(f"NFT record for token {token_id} not found")
+
+        logger.info(
+            f"✅ Successfully processed Bought event for token {token_id}: "
+            f"-> {buyer}, listing: {listing_id}"
+        )
+
+
+class IngestSupervisor:
+    """
+    多链同步监督器。
+    - 为每条已配置的链并发运行一个 ChainIngestor
+    - 各链故障相互隔离：初始化失败或同步循环异常退出时按指数退避单独重启
+    """
+
+    def __init__(self, configs: List[ChainConfig]):
+        self.ingestors = [ChainIngestor(config) for config in configs]
+        self.tasks: List[asyncio.Task] = []
+        self.is_running = False
+
+    async def _supervise(self, ingestor: ChainIngestor):
+        backoff = 1
+        lease = LeaderLease(
+            f"ingest:{ingestor.chain_name}", settings.LEADER_LEASE_SECONDS
+        )
+        while self.is_running:
+            if settings.LEADER_ELECTION_ENABLED and not self._acquire(lease):
+                # 其他副本是该链的领导者，待机并定期尝试接管
+                await asyncio.sleep(settings.LEADER_RETRY_SECONDS)
+                continue
+
+            try:
+                if settings.LEADER_ELECTION_ENABLED:
+                    await self._run_as_leader(ingestor, lease)
+                else:
+                    await ingestor.initialize()
+                    await ingestor.start_listening()
+                backoff = 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                EXCEPTIONS.labels("supervisor").inc()
+                logger.error(
+                    f"{ingestor.chain_name} ingestor failed ({e}), "
+                    f"restarting in {backoff}s"
+                )
+            finally:
+                lease.release()
+            if self.is_running:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 300)
+
+    @staticmethod
+    def _acquire(lease: LeaderLease) -> bool:
+        try:
+            return lease.try_acquire()
+        except Exception as e:
+            EXCEPTIONS.labels("leader_election").inc()
+            logger.warning(f"Leader election failed for {lease.name}: {e}")
+            return False
+
+    async def _run_as_leader(self, ingestor: ChainIngestor, lease: LeaderLease):
+        """作为领导者运行同步，心跳确认租约丢失时立即停止"""
+        logger.info(f"Became {ingestor.chain_name} ingest leader")
+        ingest_task = asyncio.create_task(self._run_ingestor(ingestor))
+        lease_task = asyncio.create_task(lease.hold(settings.LEADER_HEARTBEAT_SECONDS))
+        try:
+            done, _ = await asyncio.wait(
+                {ingest_task, lease_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            lease_task.cancel()
+            if not ingest_task.done():
+                # 租约丢失或监督器被取消：停止同步，避免与新领导者重复提交交易
+                ingestor.stop_listening()
+                ingest_task.cancel()
+            await asyncio.gather(ingest_task, lease_task, return_exceptions=True)
+
+        if ingest_task in done:
+            ingest_task.result()
+
+    @staticmethod
+    async def _run_ingestor(ingestor: ChainIngestor):
+        await ingestor.initialize()
+        await ingestor.start_listening()
+
+    def start(self):
+        """启动所有链的同步任务"""
+        self.is_running = True
+        self.tasks = [
+            asyncio.create_task(self._supervise(ingestor))
+            for ingestor in self.ingestors
+        ]
+        logger.info(
+            f"Ingest supervisor started for "
+            f"{', '.join(ingestor.chain_name for ingestor in self.ingestors)}"
+        )
+
+    async def stop(self):
+        """停止所有链的同步任务并关闭客户端连接池"""
+        self.is_running = False
+        for ingestor in self.ingestors:
+            ingestor.stop_listening()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        for ingestor in self.ingestors:
+            await ingestor.client.aclose()
+
+
+# 创建全局多链同步监督器实例
+ingest_supervisor = IngestSupervisor(load_chain_configs())
@@ -0,0 +1,154 @@
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ABI目录按模块位置定位，与进程工作目录无关
+CONTRACTS_DIR = Path(__file__).resolve().parents[2] / "contracts"
+
+ABI_ENTRY_TYPES = {"function", "event", "constructor", "error", "fallback", "receive"}
+
+CACHE_VERSION = 1
+
+
+class ContractRegistry:
+    """
+    进程内共享的ABI与合约注册表。
+    - 启动时一次性加载并校验 contracts/*.json，预先计算事件topic与函数选择器
+    - 按 (链标识, 合约地址, 合约名, web3实例) 缓存合约对象，各客户端与同步器共用
+      链标识统一使用小写的 chain_name（与 ChainConfig.name 一致）
+    - 可选的pickle缓存：ABI文件未变更时跳过解析与哈希计算，加快冷启动
+    """
+
+    def __init__(self, contracts_dir: Path = CONTRACTS_DIR, cache_path: str = ""):
+        self.contracts_dir = Path(contracts_dir)
+        self.cache_path = cache_path
+        self._abis: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._event_topics: Dict[str, Dict[str, bytes]] = {}
+        self._function_selectors: Dict[str, Dict[str, bytes]] = {}
+        self._contracts: Dict[Tuple[str, str, str, Any], Any] = {}
+
+    def _sources(self) -> Dict[str, float]:
+        return {
+            path.stem: path.stat().st_mtime
+            for path in sorted(self.contracts_dir.glob("*.json"))
+        }
+
+    @staticmethod
+    def _validate(name: str, abi: Any):
+        if not isinstance(abi, list):
+            raise ValueError(f"ABI文件格式错误: {name} 应为列表")
+        for entry in abi:
+            if not isinstance(entry, dict) or entry.get("type") not in ABI_ENTRY_TYPES:
+                raise ValueError(f"ABI文件格式错误: {name} 包含未知条目 {entry}")
+            if entry["type"] in ("function", "event") and "name" not in entry:
+                raise ValueError(f"ABI文件格式错误: {name} 的 {entry['type']} 缺少名称")
+
+    def _load_cache(self, sources: Dict[str, float]) -> bool:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ABI cache {self.cache_path}: {e}")
+            return False
+        if cached.get("version") != CACHE_VERSION or cached.get("sources") != sources:
+            return False
+
+        self._abis = cached["abis"]
+        self._event_topics = cached["event_topics"]
+        self._function_selectors = cached["function_selectors"]
+        return True
+
+    def _write_cache(self, sources: Dict[str, float]):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "version": CACHE_VERSION,
+                        "sources": sources,
+                        "abis": self._abis,
+                        "event_topics": self._event_topics,
+                        "function_selectors": self._function_selectors,
+                    },
+                    f,
+                )
+        except OSError as e:
+            logger.warning(f"Failed to write ABI cache {self.cache_path}: {e}")
+
+    def load(self) -> "ContractRegistry":
+        """加载全部ABI（只执行一次）"""
+        if self._abis is not None:
+            return self
+
+        sources = self._sources()
+        if not sources:
+            raise FileNotFoundError(f"未找到ABI文件: {self.contracts_dir}")
+        if self._load_cache(sources):
+            logger.info(f"Loaded {len(self._abis)} contract ABIs from cache")
+            return self
+
+        abis = {}
+        for name in sources:
+            with open(self.contracts_dir / f"{name}.json", "r") as f:
+                abi = json.load(f)
+            self._validate(name, abi)
+            abis[name] = abi
+
+            self._event_topics[name] = {
+                entry["name"]: bytes(event_abi_to_log_topic(entry))
+                for entry in abi
+                if entry["type"] == "event"
+            }
+            self._function_selectors[name] = {
+                entry["name"]: bytes(function_abi_to_4byte_selector(entry))
+                for entry in abi
+                if entry["type"] == "function"
+            }
+
+        self._abis = abis
+        self._write_cache(sources)
+        logger.info(f"Loaded {len(abis)} contract ABIs from {self.contracts_dir}")
+        return self
+
+    def abis(self) -> Dict[str, List[Dict[str, Any]]]:
+        """全部ABI：合约名 -> ABI"""
+        return self.load()._abis
+
+    def abi(self, name: str) -> List[Dict[str, Any]]:
+        abis = self.abis()
+        if name not in abis:
+            raise FileNotFoundError(f"未找到合约ABI: {name}")
+        return abis[name]
+
+    def event_topic(self, name: str, event_name: str) -> bytes:
+        """事件的 topic0"""
+        self.abi(name)
+        return self._event_topics[name][event_name]
+
+    def function_selector(self, name: str, function_name: str) -> bytes:
+        """函数的4字节选择器"""
+        self.abi(name)
+        return self._function_selectors[name][function_name]
+
+    def contract(self, w3: Any, chain: str, name: str, address: str) -> Any:
+        """获取共享的合约对象，同一链、地址与web3实例只创建一次"""
+        key = (chain.lower(), address.lower(), name, w3)
+        if key not in self._contracts:
+            self._contracts[key] = w3.eth.contract(address=address, abi=self.abi(name))
+        return self._contracts[key]
+
+
+# 创建全局唯一的合约注册表实例
+contract_registry = ContractRegistry(cache_path=settings.CONTRACT_ABI_CACHE)
@@ -2,39 +2,88 @@ import asyncio
 import json
 import logging
 import hashlib
+import time
+import unicodedata
 import aiohttp
+import numpy as np
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from app.config import settings
+from app.utils.price_cache import PriceCache
+from app.utils.single_flight import SingleFlight
+from app.utils.metrics import PRICING_BATCH_SIZE, PRICING_DEDUPLICATED
 
 logger = logging.getLogger(__name__)
 
 PRICING_API_URL = "https://api.example.com/v1/nft/evaluate"
 
 
-async def call_pricing_api(content: str) -> Optional[float]:
+class PricingClient:
+    """
+    估价API客户端。
+    - 每个进程共享一个长连接会话，复用TCP/TLS连接与DNS缓存
+    - 在应用启动时创建、关闭时释放；未启动时首次调用会自动创建
+    - 配置了批量接口时支持一次请求估价多条内容，接口不可用时标记为不支持
+    - 批量接口连续 max_batch_failures 次超时、连接失败、返回错误状态或格式不符时同样停用，避免每批都多一次失败请求
     """
-    调用外部估价 API
 
-    Args:
-        content: 要评估的内容
+    # 批量接口返回这些状态码时视为服务端不支持批量估价
+    BATCH_UNSUPPORTED_STATUSES = (400, 404, 405, 501)
 
-    Returns:
-        估价结果
-    """
-    try:
-        async with aiohttp.ClientSession() as session:
-            payload = {"content": content}
-
-            headers = {
-                "Content-Type": "application/json",
-            }
-
-            async with session.post(
-                PRICING_API_URL,
-                json=payload,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
+    def __init__(
+        self,
+        url: str = PRICING_API_URL,
+        pool_size: int = 50,
+        timeout: float = 30,
+        keepalive_timeout: float = 60,
+        batch_url: Optional[str] = None,
+        max_batch_failures: int = 3,
+    ):
+        self.url = url
+        self.batch_url = batch_url or None
+        self.batch_supported = self.batch_url is not None
+        self.max_batch_failures = max(1, max_batch_failures)
+        self.batch_failures = 0
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self):
+        """创建连接池会话"""
+        if self._session is not None and not self._session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def close(self):
+        """关闭连接池会话"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def price(self, content: str) -> Optional[float]:
+        """
+        调用外部估价 API
+
+        Args:
+            content: 要评估的内容
+
+        Returns:
+            估价结果，失败时返回 None
+        """
+        await self.start()
+        try:
+            async with self._session.post(
+                self.url, json={"content": content}
             ) as response:
                 if response.status == 200:
                     result = await response.json()
@@ -47,12 +96,231 @@ async def call_pricing_api(content: str) -> Optional[float]:
                     logger.error(f"估价失败，状态码: {response.status}")
                     return None
 
-    except asyncio.TimeoutError:
-        logger.error("估价超时")
-        return None
-    except Exception as e:
-        logger.error(f"估价异常: {e}")
-        return None
+        except asyncio.TimeoutError:
+            logger.error("估价超时")
+            return None
+        except Exception as e:
+            logger.error(f"估价异常: {e}")
+            return None
+
+    async def price_batch(
+        self, contents: List[str]
+    ) -> Optional[List[Optional[float]]]:
+        """
+        调用批量估价 API：请求 {"contents": [...]}，响应 {"prices": [...]}
+
+        Args:
+            contents: 要评估的内容列表
+
+        Returns:
+            与 contents 一一对应的估价结果（单条可能为 None），整批失败时返回 None
+        """
+        if not self.batch_supported:
+            return None
+        await self.start()
+        try:
+            async with self._session.post(
+                self.batch_url, json={"contents": contents}
+            ) as response:
+                if response.status in self.BATCH_UNSUPPORTED_STATUSES:
+                    self.batch_supported = False
+                    logger.warning(
+                        f"批量估价接口不可用（状态码: {response.status}），改为逐条估价"
+                    )
+                    return None
+                if response.status != 200:
+                    logger.error(f"批量估价失败，状态码: {response.status}")
+                    self._record_batch_failure()
+                    return None
+
+                try:
+                    prices = (await response.json()).get("prices")
+                except (aiohttp.ContentTypeError, ValueError, AttributeError):
+                    prices = None
+                if not isinstance(prices, list) or len(prices) != len(contents):
+                    logger.error("批量估价响应格式错误")
+                    self._record_batch_failure()
+                    return None
+                self.batch_failures = 0
+                return prices
+
+        except asyncio.TimeoutError:
+            logger.error("批量估价超时")
+            self._record_batch_failure()
+            return None
+        except aiohttp.ClientError as e:
+            logger.error(f"批量估价请求失败: {e}")
+            self._record_batch_failure()
+            return None
+        except Exception as e:
+            logger.error(f"批量估价异常: {e}")
+            return None
+
+    def _record_batch_failure(self):
+        self.batch_failures += 1
+        if self.batch_failures >= self.max_batch_failures:
+            self.batch_supported = False
+            logger.warning(
+                f"批量估价接口连续 {self.batch_failures} 次响应异常，改为逐条估价"
+            )
+
+
+class PricingBatcher:
+    """
+    估价请求微批处理器。
+    - 在 window 秒内或攒满 max_items 条后合并为一次批量请求，结果分发回各调用方
+    - 批量接口不支持、整批失败或单条缺失结果时，对应内容退回逐条估价
+    - 估价API仍未给出结果的内容，整批一次用 calculate_price_traditional_batch 兜底
+    """
+
+    def __init__(
+        self, client: PricingClient, window: float = 0.005, max_items: int = 32
+    ):
+        self.client = client
+        self.window = window
+        self.max_items = max_items
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._sending: set = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_items > 1 and self.client.batch_supported
+
+    async def price(self, content: str) -> Tuple[float, bool]:
+        """
+        加入当前批次并等待估价结果
+
+        Returns:
+            (估价结果, 是否来自估价API)；API失败时为传统算法的兜底估价
+        """
+        if not self.enabled:
+            price = await self.client.price(content)
+            if price is None:
+                return calculate_price_traditional(content), False
+            return price, True
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((content, future))
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]):
+        # 已取消的调用方不再估价
+        batch = [(content, future) for content, future in batch if not future.done()]
+        if not batch:
+            return
+        try:
+            if len(batch) == 1:
+                prices = [None]
+            else:
+                PRICING_BATCH_SIZE.observe(len(batch))
+                prices = await self.client.price_batch(
+                    [content for content, _ in batch]
+                ) or [None] * len(batch)
+
+            failed: List[Tuple[str, asyncio.Future]] = []
+
+            async def resolve(content: str, future: asyncio.Future, price):
+                if price is None:
+                    price = await self.client.price(content)
+                if price is None:
+                    failed.append((content, future))
+                elif not future.done():
+                    future.set_result((price, True))
+
+            await asyncio.gather(
+                *(
+                    resolve(content, future, price)
+                    for (content, future), price in zip(batch, prices)
+                )
+            )
+
+            # API未给出结果的内容一次性用传统算法批量兜底
+            if failed:
+                fallback_prices = calculate_price_traditional_batch(
+                    [content for content, _ in failed]
+                )
+                for (_, future), price in zip(failed, fallback_prices):
+                    if not future.done():
+                        future.set_result((price, False))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def close(self):
+        """发送剩余批次并等待进行中的请求完成"""
+        self._flush()
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+
+# 创建全局唯一的估价API客户端实例
+pricing_client = PricingClient(
+    pool_size=settings.PRICING_POOL_SIZE,
+    timeout=settings.PRICING_TIMEOUT_SECONDS,
+    keepalive_timeout=settings.PRICING_KEEPALIVE_SECONDS,
+    batch_url=settings.PRICING_BATCH_URL,
+    max_batch_failures=settings.PRICING_BATCH_MAX_FAILURES,
+)
+
+# 创建全局唯一的估价微批处理器实例
+pricing_batcher = PricingBatcher(
+    pricing_client,
+    window=settings.PRICING_BATCH_WINDOW_MS / 1000,
+    max_items=settings.PRICING_BATCH_MAX_ITEMS,
+)
+
+
+async def call_pricing_api(content: str) -> Tuple[float, bool]:
+    """
+    调用外部估价 API（使用共享的长连接会话，并发请求合并为批量请求）
+
+    Args:
+        content: 要评估的内容
+
+    Returns:
+        (估价结果, 是否来自估价API)；API失败时为传统算法的兜底估价
+    """
+    return await pricing_batcher.price(content)
+
+
+# 创建全局唯一的估价缓存实例
+price_cache = PriceCache(
+    settings.PRICING_MODEL_VERSION,
+    max_items=settings.PRICE_CACHE_MAX_ITEMS,
+    memory_ttl=settings.PRICE_CACHE_MEMORY_TTL_SECONDS,
+    db_ttl=settings.PRICE_CACHE_DB_TTL_SECONDS,
+)
+
+
+# 进行中的估价请求表：同一进程内各链的相同内容只请求一次估价API
+pricing_flights = SingleFlight(PRICING_DEDUPLICATED)
+
+
+def content_hash(content: str) -> str:
+    """
+    估价缓存键：规范化内容（Unicode NFC、合并空白）与估价模型版本的SHA-256
+    """
+    normalized = " ".join(unicodedata.normalize("NFC", content).split())
+    key = f"{settings.PRICING_MODEL_VERSION}\n{normalized}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
 
 
 def calculate_price_traditional(content: str) -> float:
@@ -88,6 +356,65 @@ def calculate_price_traditional(content: str) -> float:
     return max(0.001, min(total_price, 1.0))
 
 
+def calculate_price_traditional_batch(contents: List[str]) -> List[float]:
+    """
+    传统算法批量估价，结果与逐条调用 calculate_price_traditional 完全一致。
+    所有内容拼接为一个码点数组，用 NumPy 一次计算各条的长度、字符种类与特殊字符因子；
+    isalnum/isspace 只对出现过的不同码点各判断一次，查表大小随不同码点数而非整个Unicode范围增长。
+
+    Args:
+        contents: 要评估的内容列表
+
+    Returns:
+        与 contents 一一对应的估价结果
+    """
+    count = len(contents)
+    lengths = np.fromiter(map(len, contents), dtype=np.int64, count=count)
+    codes = np.frombuffer(
+        "".join(contents).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    if codes.size == 0:
+        return [0.001] * count
+
+    # 每个码点所属的内容下标
+    owners = np.repeat(np.arange(count, dtype=np.int64), lengths)
+
+    # (内容下标, 码点) 排序后去重：每段即一条内容中的一种字符，段长为其出现次数
+    span = int(codes.max()) + 1
+    keys = np.sort(owners * span + codes)
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    starts = np.flatnonzero(first)
+    pair_keys = keys[starts]
+    pair_counts = np.diff(np.append(starts, len(keys)))
+    pair_owners = pair_keys // span
+
+    # 查表只覆盖出现过的码点（按大小编号），而非整个Unicode范围
+    pair_codes = pair_keys % span
+    distinct = np.unique(pair_codes)
+    rank = np.searchsorted(distinct, pair_codes)
+    is_special = np.fromiter(
+        (not c.isalnum() and not c.isspace() for c in map(chr, distinct.tolist())),
+        dtype=bool,
+        count=len(distinct),
+    )
+
+    unique_chars = np.bincount(pair_owners, minlength=count)
+    special_chars = np.bincount(
+        pair_owners, weights=pair_counts * is_special[rank], minlength=count
+    )
+
+    base_price = 0.01
+    length_factor = np.minimum(lengths / 1000, 0.5)
+    complexity_factor = np.minimum(unique_chars / 100, 0.3)
+    special_factor = np.minimum(special_chars / 50, 0.2)
+
+    total_price = base_price + length_factor + complexity_factor + special_factor
+    prices = np.maximum(0.001, np.minimum(total_price, 1.0))
+    prices[lengths == 0] = 0.001
+    return prices.tolist()
+
+
 async def calculate_price(content: str) -> float:
     """
     智能价格评估算法
@@ -95,10 +422,26 @@ async def calculate_price(content: str) -> float:
     Args:
         content: 要评估的内容
     """
+    key = content_hash(content)
+    cached_price = await price_cache.get(key)
+    if cached_price is not None:
+        return cached_price
+
+    return await pricing_flights.do(key, lambda: _price_uncached(content, key))
+
+
+async def _price_uncached(content: str, key: str) -> float:
+    """缓存未命中时调用估价API，失败时回退传统算法（兜底估价不写入缓存）"""
     try:
-        price = await call_pricing_api(content)
-        if price is not None:
-            return price
+        started = time.perf_counter()
+        price, from_api = await call_pricing_api(content)
+        if from_api:
+            await price_cache.put(
+                key, price, api_seconds=time.perf_counter() - started
+            )
+        else:
+            logger.info(f"使用传统算法估价: {price}")
+        return price
 
     except Exception as e:
         logger.error(f"API估价失败: {e}")
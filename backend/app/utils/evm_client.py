@@ -2,6 +2,8 @@ from web3 import Web3
 from typing import Optional, Dict, Any
 import json
 from app.config import settings
+from app.utils.async_chain_client import AsyncChainClient
+from app.utils.contract_registry import contract_registry
 
 
 class EVMClient:
@@ -42,11 +44,9 @@ class EVMClient:
 
             self._chain_id = self._w3.eth.chain_id
 
-            with open("contracts/AiTextNFT.json", "r") as f:
-                contract_abi = json.load(f)
-
             self._contract = self._w3.eth.contract(
-                address=self.contract_address, abi=contract_abi
+                address=self.contract_address,
+                abi=contract_registry.abi("AiTextNFT"),
             )
 
             self._initialized = True
@@ -207,3 +207,22 @@ class EVMClient:
 
 # 创建全局唯一的EVM客户端实例
 evm_client = EVMClient()
+
+
+class AsyncEVMClient(AsyncChainClient):
+    """EVM异步客户端，供事件监听器在事件循环中使用"""
+
+    chain_label = "EVM"
+    chain_name = "evm"
+    network_names = {
+        42220: "Celo Mainnet",
+        44787: "Celo Alfajores",
+    }
+
+    def _load_config(self):
+        rpc_url = settings.EVM_RPC_URLS or settings.EVM_RPC_URL
+        return rpc_url, settings.NFT_CONTRACT_ADDRESS
+
+
+# 创建全局唯一的EVM异步客户端实例
+async_evm_client = AsyncEVMClient()
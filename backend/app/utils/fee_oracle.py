@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from web3 import AsyncWeb3
+
+logger = logging.getLogger(__name__)
+
+
+class FeeOracle:
+    """
+    基于 eth_feeHistory 的手续费预言机，由各链异步客户端共享使用。
+    - 后台定期刷新，构建交易时直接读取短TTL缓存，省去每笔交易一次RPC
+    - 按奖励百分位给出 maxPriorityFeePerGas，maxFeePerGas = 基础费 * 倍数 + 小费
+    - 链不支持 EIP-1559（无 baseFee）时回退为 gasPrice
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        ttl: float = 10,
+        block_count: int = 20,
+        reward_percentile: float = 50,
+        base_fee_multiplier: float = 2,
+        max_fee_cap_wei: Optional[int] = None,
+    ):
+        self.w3 = w3
+        self.ttl = ttl
+        self.block_count = block_count
+        self.reward_percentile = reward_percentile
+        self.base_fee_multiplier = base_fee_multiplier
+        self.max_fee_cap_wei = max_fee_cap_wei
+        self._fees: Optional[Dict[str, int]] = None
+        self._updated_at = 0.0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def _cap(self, value: int) -> int:
+        if self.max_fee_cap_wei:
+            return min(value, self.max_fee_cap_wei)
+        return value
+
+    @property
+    def is_stale(self) -> bool:
+        """缓存为空或已过期"""
+        return self._fees is None or time.monotonic() - self._updated_at > self.ttl
+
+    async def refresh(self) -> Dict[str, int]:
+        """从链上刷新手续费建议"""
+        history = await self.w3.eth.fee_history(
+            self.block_count, "latest", [self.reward_percentile]
+        )
+        gas_price = None
+        if not self._next_base_fee(history):
+            gas_price = await self.w3.eth.gas_price
+        return self.update(history, gas_price)
+
+    @staticmethod
+    def _next_base_fee(history: Dict[str, Any]) -> int:
+        base_fees = history.get("baseFeePerGas") or []
+        return base_fees[-1] if base_fees else 0
+
+    def update(
+        self, history: Dict[str, Any], gas_price: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        用已获取的 eth_feeHistory（及 eth_gasPrice）结果更新缓存，
+        供批量RPC请求直接写入
+        """
+        next_base_fee = self._next_base_fee(history)
+
+        if not next_base_fee:
+            fees = {"gasPrice": self._cap(gas_price)}
+        else:
+            rewards = sorted(
+                reward[0] for reward in history.get("reward") or [] if reward
+            )
+            priority_fee = rewards[len(rewards) // 2] if rewards else 0
+            max_fee = int(next_base_fee * self.base_fee_multiplier) + priority_fee
+            fees = {
+                "maxFeePerGas": self._cap(max_fee),
+                "maxPriorityFeePerGas": self._cap(priority_fee),
+            }
+
+        self._fees = fees
+        self._updated_at = time.monotonic()
+        return fees
+
+    async def get_fees(self) -> Dict[str, int]:
+        """
+        获取交易手续费字段
+
+        Returns:
+            {"maxFeePerGas", "maxPriorityFeePerGas"} 或 {"gasPrice"}
+        """
+        self._ensure_refreshing()
+        if self.is_stale:
+            async with self._lock:
+                if self.is_stale:
+                    await self.refresh()
+        return dict(self._fees)
+
+    @staticmethod
+    def max_fee_per_gas(fees: Dict[str, Any]) -> int:
+        """手续费字段对应的每单位gas最高价格，用于估算交易成本"""
+        return fees.get("maxFeePerGas", fees.get("gasPrice", 0))
+
+    def _ensure_refreshing(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.ttl / 2)
+            try:
+                async with self._lock:
+                    await self.refresh()
+            except Exception as e:
+                logger.warning(f"Fee oracle refresh failed: {e}")
+
+    def stop(self):
+        """停止后台刷新"""
+        if self._task:
+            self._task.cancel()
+            self._task = None
@@ -104,3 +104,20 @@ def authenticate(credentials: HTTPAuthorizationCredentials = Depends(security))
         )
 
     return decoded["address"]
+
+
+def require_admin(address: str = Depends(authenticate)) -> str:
+    """
+    管理接口认证依赖函数
+    要求JWT中的地址在 ADMIN_ADDRESSES 中
+    """
+    admins = {
+        admin.strip().lower()
+        for admin in settings.ADMIN_ADDRESSES.split(",")
+        if admin.strip()
+    }
+    if address.lower() not in admins:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required."
+        )
+    return address
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLease:
+    """
+    基于 MySQL GET_LOCK 的领导者租约，每条链一把锁。
+    - 锁绑定在一条专用数据库连接上：进程退出或连接断开时MySQL立即释放锁
+    - 该连接的 wait_timeout 设为租约时长，领导者卡死停止心跳时由MySQL断开连接回收锁
+    - 心跳确认锁仍由本连接持有，丢失时领导者主动停止同步
+    """
+
+    def __init__(self, name: str, lease_seconds: int = 30):
+        # MySQL 锁名最长64个字符
+        self.name = f"{settings.MYSQL_DATABASE}:{name}"[:64]
+        self.lease_seconds = lease_seconds
+        self._connection: Optional[Connection] = None
+
+    @property
+    def held(self) -> bool:
+        return self._connection is not None
+
+    def try_acquire(self) -> bool:
+        """尝试获取锁，不等待"""
+        if self.held:
+            return True
+
+        connection = engine.connect()
+        try:
+            connection.execute(
+                text(f"SET SESSION wait_timeout = {int(self.lease_seconds)}")
+            )
+            acquired = connection.execute(
+                text("SELECT GET_LOCK(:name, 0)"), {"name": self.name}
+            ).scalar()
+        except Exception:
+            connection.close()
+            raise
+
+        if acquired != 1:
+            connection.close()
+            return False
+
+        self._connection = connection
+        logger.info(f"Acquired leader lease {self.name}")
+        return True
+
+    def heartbeat(self) -> bool:
+        """确认锁仍由本连接持有"""
+        if not self.held:
+            return False
+        try:
+            holding = self._connection.execute(
+                text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"),
+                {"name": self.name},
+            ).scalar()
+        except Exception as e:
+            logger.warning(f"Leader lease {self.name} heartbeat failed: {e}")
+            holding = False
+
+        if not holding:
+            self._discard()
+        return bool(holding)
+
+    def release(self):
+        """释放锁并关闭专用连接"""
+        if not self.held:
+            return
+        try:
+            self._connection.execute(
+                text("SELECT RELEASE_LOCK(:name)"), {"name": self.name}
+            )
+            logger.info(f"Released leader lease {self.name}")
+        except Exception as e:
+            logger.warning(f"Failed to release leader lease {self.name}: {e}")
+        finally:
+            self._discard()
+
+    def _discard(self):
+        # 专用连接修改过 wait_timeout，直接作废而不归还连接池
+        try:
+            self._connection.invalidate()
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+    async def hold(self, interval: float):
+        """按间隔发送心跳，租约丢失时返回"""
+        while True:
+            await asyncio.sleep(interval)
+            if not self.heartbeat():
+                break
+        logger.warning(f"Lost leader lease {self.name}")
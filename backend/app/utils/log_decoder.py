@@ -0,0 +1,188 @@
+import glob
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from eth_abi import decode as abi_decode
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+
+from app.utils.contract_registry import contract_registry
+
+logger = logging.getLogger(__name__)
+
+WORD = 32
+
+# 解码结果中从原始日志透传的字段
+LOG_FIELDS = (
+    "address",
+    "blockHash",
+    "blockNumber",
+    "logIndex",
+    "transactionHash",
+    "transactionIndex",
+)
+
+
+@lru_cache(maxsize=4096)
+def _checksum(raw: bytes) -> str:
+    """地址校验和计算较慢，同一地址在日志中反复出现，缓存结果"""
+    return to_checksum_address(raw)
+
+
+def _read_word(view: memoryview, offset: int) -> int:
+    return int.from_bytes(view[offset : offset + WORD], "big")
+
+
+def _static_reader(abi_type: str) -> Optional[Callable[[memoryview, int], Any]]:
+    """返回静态类型在指定偏移处的读取函数；不支持的类型返回 None"""
+    if abi_type.startswith("uint"):
+        return _read_word
+    if abi_type.startswith("int"):
+        return lambda view, offset: int.from_bytes(
+            view[offset : offset + WORD], "big", signed=True
+        )
+    if abi_type == "address":
+        return lambda view, offset: _checksum(bytes(view[offset + 12 : offset + WORD]))
+    if abi_type == "bool":
+        return lambda view, offset: view[offset + WORD - 1] != 0
+    if abi_type.startswith("bytes") and abi_type[5:].isdigit():
+        size = int(abi_type[5:])
+        return lambda view, offset: bytes(view[offset : offset + size])
+    return None
+
+
+def _dynamic_reader(abi_type: str) -> Optional[Callable[[memoryview, int], Any]]:
+    """返回动态类型（string/bytes）的读取函数，直接在 memoryview 上切片"""
+    if abi_type not in ("string", "bytes"):
+        return None
+
+    def read(view: memoryview, offset: int) -> Any:
+        start = _read_word(view, offset)
+        length = _read_word(view, start)
+        payload = view[start + WORD : start + WORD + length]
+        if abi_type == "string":
+            # 直接从 memoryview 解码，不产生中间 bytes 拷贝
+            return str(payload, "utf-8")
+        return bytes(payload)
+
+    return read
+
+
+class FastEventDecoder:
+    """
+    单个事件的预编译解码器，与 web3 事件对象的 process_log 接口一致。
+    - indexed 参数从 topics 读取，非 indexed 参数按ABI头部偏移直接切片 data
+    - 含数组、元组等不支持的类型时，非 indexed 部分退回 eth_abi 解码
+    """
+
+    def __init__(self, event_abi: Dict[str, Any]):
+        self.name = event_abi["name"]
+        self.topic = bytes(event_abi_to_log_topic(event_abi))
+        inputs = event_abi.get("inputs", [])
+        self.layout = tuple(
+            (item["name"], item["type"], bool(item.get("indexed"))) for item in inputs
+        )
+
+        self._topic_readers: List[Tuple[str, Callable]] = []
+        for item in (item for item in inputs if item.get("indexed")):
+            reader = _static_reader(item["type"])
+            if reader is None:
+                # 动态类型的 indexed 参数在 topic 中只保存哈希
+                reader = lambda view, offset: bytes(view)  # noqa: E731
+            self._topic_readers.append((item["name"], reader))
+
+        data_inputs = [item for item in inputs if not item.get("indexed")]
+        self._data_names = [item["name"] for item in data_inputs]
+        self._data_types = [item["type"] for item in data_inputs]
+        readers = [
+            _static_reader(abi_type) or _dynamic_reader(abi_type)
+            for abi_type in self._data_types
+        ]
+        self._data_readers = None if None in readers else readers
+
+    def decode_args(self, topics: List[bytes], data: bytes) -> Dict[str, Any]:
+        """解码事件参数"""
+        args: Dict[str, Any] = {}
+        for (name, reader), topic in zip(self._topic_readers, topics[1:]):
+            args[name] = reader(memoryview(topic), 0)
+
+        if self._data_readers is None:
+            values = abi_decode(self._data_types, bytes(data))
+            args.update(zip(self._data_names, values))
+            return args
+
+        view = memoryview(data)
+        for index, (name, reader) in enumerate(
+            zip(self._data_names, self._data_readers)
+        ):
+            args[name] = reader(view, index * WORD)
+        return args
+
+    def process_log(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """解码一条原始日志，返回与 web3 事件数据相同键的普通字典"""
+        event = {field: log[field] for field in LOG_FIELDS if field in log}
+        event["event"] = self.name
+        event["args"] = self.decode_args(log["topics"], log["data"])
+        return event
+
+
+class LogDecoderRegistry:
+    """
+    事件解码器注册表：topic0 -> 预编译解码器。
+    在启动时由ABI文件一次性构建，解码时不再解析ABI。
+    """
+
+    def __init__(self):
+        self.decoders: Dict[bytes, FastEventDecoder] = {}
+
+    def register_abi(self, abi: Iterable[Dict[str, Any]]):
+        for item in abi:
+            if item.get("type") != "event" or item.get("anonymous"):
+                continue
+            decoder = FastEventDecoder(item)
+            existing = self.decoders.get(decoder.topic)
+            if existing is not None and existing.layout != decoder.layout:
+                logger.warning(
+                    f"Event {decoder.name} topic registered twice with different "
+                    f"indexed layout, keeping the first"
+                )
+                continue
+            self.decoders.setdefault(decoder.topic, decoder)
+
+    def get(self, topic: bytes) -> Optional[FastEventDecoder]:
+        return self.decoders.get(bytes(topic))
+
+    def decode(self, log: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """按 topic0 解码日志，未注册的事件返回 None"""
+        if not log["topics"]:
+            return None
+        decoder = self.get(log["topics"][0])
+        return decoder.process_log(log) if decoder else None
+
+    @classmethod
+    def from_abi_files(cls, pattern: str) -> "LogDecoderRegistry":
+        registry = cls()
+        for path in sorted(glob.glob(pattern)):
+            with open(path, "r") as f:
+                registry.register_abi(json.load(f))
+        logger.info(
+            f"Loaded {len(registry.decoders)} event decoders from "
+            f"{os.path.dirname(pattern) or '.'}"
+        )
+        return registry
+
+
+_default_registry: Optional[LogDecoderRegistry] = None
+
+
+def get_log_decoder_registry() -> LogDecoderRegistry:
+    """进程内共享的解码器注册表，首次使用时由合约注册表中的全部ABI构建"""
+    global _default_registry
+    if _default_registry is None:
+        registry = LogDecoderRegistry()
+        for abi in contract_registry.abis().values():
+            registry.register_abi(abi)
+        _default_registry = registry
+    return _default_registry
@@ -0,0 +1,82 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# 事件同步指标，以 Prometheus 文本格式暴露在 /metrics
+
+CHAIN_HEAD_BLOCK = Gauge(
+    "mooncl_chain_head_block", "Latest block number reported by the node", ["chain"]
+)
+CHAIN_PROCESSED_BLOCK = Gauge(
+    "mooncl_chain_processed_block",
+    "Last block fully applied to the database",
+    ["chain"],
+)
+CHAIN_LAG_BLOCKS = Gauge(
+    "mooncl_chain_lag_blocks", "Head block minus processed block", ["chain"]
+)
+MINT_QUEUE_SIZE = Gauge(
+    "mooncl_mint_queue_size", "Mint jobs waiting in the pipeline queues", ["chain"]
+)
+MINT_IN_FLIGHT = Gauge(
+    "mooncl_mint_in_flight", "Mint jobs being processed by pipeline workers", ["chain"]
+)
+
+EVENTS_PROCESSED = Counter(
+    "mooncl_events_processed_total", "Chain events applied", ["chain", "event"]
+)
+EXCEPTIONS = Counter(
+    "mooncl_exceptions_total",
+    "Exceptions caught and logged without being re-raised",
+    ["component"],
+)
+
+# 秒级延迟分桶：覆盖从毫秒级DB写入到分钟级交易确认
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1, 2.5, 5, 10, 30, 60, 120, 300,
+)  # fmt: skip
+
+GET_LOGS_SECONDS = Histogram(
+    "mooncl_get_logs_seconds",
+    "eth_getLogs duration per window",
+    ["chain"],
+    buckets=LATENCY_BUCKETS,
+)
+PRICING_SECONDS = Histogram(
+    "mooncl_pricing_seconds",
+    "Content pricing duration per minted token",
+    ["chain"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_WRITE_SECONDS = Histogram(
+    "mooncl_db_write_seconds",
+    "Database write duration",
+    ["chain", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+PRICE_CACHE_LOOKUPS = Counter(
+    "mooncl_price_cache_lookups_total",
+    "Price cache lookups by result (memory hit, db hit, miss)",
+    ["result"],
+)
+PRICE_CACHE_SAVED_SECONDS = Counter(
+    "mooncl_price_cache_saved_seconds_total",
+    "Estimated pricing API time saved by cache hits",
+)
+
+PRICING_BATCH_SIZE = Histogram(
+    "mooncl_pricing_batch_size",
+    "Contents sent per batched pricing API request",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+PRICING_DEDUPLICATED = Counter(
+    "mooncl_pricing_deduplicated_total",
+    "Pricing requests served by an identical request already in flight",
+)
+
+SET_PRICE_RECEIPT_SECONDS = Histogram(
+    "mooncl_set_price_receipt_seconds",
+    "Price transaction submit-to-receipt time",
+    ["chain"],
+    buckets=LATENCY_BUCKETS,
+)
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List
+
+from app.utils.metrics import MINT_IN_FLIGHT, MINT_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class MintPipeline:
+    """
+    有界并发的铸造处理流水线。
+    - N 个 worker，每个 worker 拥有独立的有界队列
+    - 相同 key（token_id）的任务总是路由到同一个 worker，保证单个token内的顺序
+    - 队列满时 submit 会等待，从而对上游的事件拉取形成背压
+    - 排队数与执行中任务数以该链为标签暴露在 /metrics
+    """
+
+    def __init__(self, name: str, workers: int = 4, queue_size: int = 100):
+        self.name = name
+        self.workers = max(1, workers)
+        self.shard_size = max(1, queue_size // self.workers)
+        self._queues: List[asyncio.Queue] = []
+        self._tasks: List[asyncio.Task] = []
+        self._in_flight = 0
+        MINT_QUEUE_SIZE.labels(name).set_function(lambda: self.queue_size)
+        MINT_IN_FLIGHT.labels(name).set_function(lambda: self.in_flight)
+
+    def _ensure_started(self):
+        if self._tasks:
+            return
+        self._queues = [asyncio.Queue(self.shard_size) for _ in range(self.workers)]
+        self._tasks = [
+            asyncio.create_task(self._worker(queue)) for queue in self._queues
+        ]
+        logger.info(f"{self.name} mint pipeline started with {self.workers} workers")
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            job, future = await queue.get()
+            self._in_flight += 1
+            try:
+                if not future.cancelled():
+                    future.set_result(await job())
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            finally:
+                self._in_flight -= 1
+                queue.task_done()
+
+    async def submit(self, key: Any, job: Job) -> asyncio.Future:
+        """
+        提交一个任务，队列满时等待。
+
+        Args:
+            key: 排序键，相同键的任务按提交顺序执行
+            job: 无参协程函数
+
+        Returns:
+            任务结果的 Future
+        """
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues[hash(key) % self.workers]
+        await queue.put((job, future))
+        return future
+
+    @property
+    def queue_size(self) -> int:
+        """排队中的任务数"""
+        return sum(queue.qsize() for queue in self._queues)
+
+    @property
+    def in_flight(self) -> int:
+        """正在执行的任务数"""
+        return self._in_flight
+
+    def stop(self):
+        """停止所有 worker"""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._queues = []
@@ -2,6 +2,8 @@ from web3 import Web3
 from typing import Optional, Dict, Any
 import json
 from app.config import settings
+from app.utils.async_chain_client import AsyncChainClient
+from app.utils.contract_registry import contract_registry
 
 
 class PolkadotClient:
@@ -42,11 +44,9 @@ class PolkadotClient:
 
             self._chain_id = self._w3.eth.chain_id
 
-            with open("contracts/AiTextNFT.json", "r") as f:
-                contract_abi = json.load(f)
-
             self._contract = self._w3.eth.contract(
-                address=self.contract_address, abi=contract_abi
+                address=self.contract_address,
+                abi=contract_registry.abi("AiTextNFT"),
             )
 
             self._initialized = True
@@ -206,3 +206,18 @@ class PolkadotClient:
 
 
 polkadot_client = PolkadotClient()
+
+
+class AsyncPolkadotClient(AsyncChainClient):
+    """Polkadot异步客户端，供事件监听器在事件循环中使用"""
+
+    chain_label = "Polkadot"
+    chain_name = "polkadot"
+    network_names = {}
+
+    def _load_config(self):
+        rpc_url = settings.POLKADOT_RPC_URLS or settings.POLKADOT_RPC_URL
+        return rpc_url, settings.POLKADOT_NFT_CONTRACT_ADDRESS
+
+
+async_polkadot_client = AsyncPolkadotClient()
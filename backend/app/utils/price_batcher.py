@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PriceBatcher:
+    """
+    定价合并器。
+    - 收集短时间窗口内（或达到条数上限）的待定价token
+    - 合并为一笔 batchSetPrice 交易提交，减少手续费与nonce竞争
+    - 批量交易失败时退回逐个 setPrice，避免单个坏token拖累整批
+    """
+
+    def __init__(self, client: Any, max_wait: float = 0.5, max_items: int = 50):
+        self.client = client
+        self.max_wait = max_wait
+        self.max_items = max(1, max_items)
+        self._pending: List[Tuple[int, int, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._flushing: Set[asyncio.Task] = set()
+
+    def enqueue(self, token_id: int, price_wei: int) -> asyncio.Future:
+        """
+        加入待定价队列，不等待提交结果。
+        调用方（如铸造worker）可以立即处理下一个token，批次大小不受其并发数限制
+
+        Returns:
+            所在批次结果的 Future，结果格式与 set_nft_price 相同
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((token_id, price_wei, future))
+
+        if len(self._pending) >= self.max_items:
+            self._flush_now()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+        return future
+
+    async def set_price(self, token_id: int, price_wei: int) -> Dict[str, Any]:
+        """加入待定价队列并等待所在批次的结果"""
+        return await self.enqueue(token_id, price_wei)
+
+    def _flush_now(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._flush(batch))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.max_wait)
+        self._timer = None
+        batch, self._pending = self._pending, []
+        await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[int, int, asyncio.Future]]):
+        try:
+            results = await self._submit(batch)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _submit(
+        self, batch: List[Tuple[int, int, asyncio.Future]]
+    ) -> List[Dict[str, Any]]:
+        token_ids = [token_id for token_id, _, _ in batch]
+        prices = [price_wei for _, price_wei, _ in batch]
+
+        if len(batch) == 1:
+            results = [await self.client.set_nft_price(token_ids[0], prices[0])]
+        else:
+            logger.info(f"Submitting batchSetPrice for {len(batch)} tokens")
+            result = await self.client.batch_set_nft_prices(token_ids, prices)
+            if result["success"]:
+                results = [
+                    {**result, "token_id": token_id, "price_wei": price_wei}
+                    for token_id, price_wei in zip(token_ids, prices)
+                ]
+            else:
+                logger.warning(
+                    f"batchSetPrice failed ({result['error']}), "
+                    f"falling back to single setPrice"
+                )
+                results = await asyncio.gather(
+                    *(
+                        self.client.set_nft_price(token_id, price_wei)
+                        for token_id, price_wei in zip(token_ids, prices)
+                    )
+                )
+
+        return results
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from app.dao.price_cache_dao import PriceCacheDAO
+from app.database import get_db
+from app.utils.metrics import PRICE_CACHE_LOOKUPS, PRICE_CACHE_SAVED_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class PriceCache:
+    """
+    按内容哈希缓存估价结果的两级缓存。
+    - 一级：进程内 LRU，带 TTL
+    - 二级：price_cache 表，跨进程、跨重启共享
+    - 只缓存估价API的结果，传统算法的兜底估价不缓存，以便API恢复后重新估价
+    - persistent=False 时只使用内存一级
+    - get/put 为协程：内存一级直接读写，数据库一级在线程中执行，不阻塞事件循环
+    """
+
+    def __init__(
+        self,
+        model_version: str,
+        max_items: int = 10000,
+        memory_ttl: float = 3600,
+        db_ttl: float = 7 * 24 * 3600,
+        persistent: bool = True,
+    ):
+        self.model_version = model_version
+        self.max_items = max_items
+        self.memory_ttl = memory_ttl
+        self.db_ttl = db_ttl
+        self.persistent = persistent
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        # 估价API平均耗时，用于估算缓存命中节省的时间
+        self._api_seconds = 0.0
+        self.hits_memory = 0
+        self.hits_db = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def _get_memory(self, key: str) -> Optional[float]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        price, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return price
+
+    def _put_memory(self, key: str, price: float):
+        self._entries[key] = (price, time.monotonic() + self.memory_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+
+    def _get_db(self, key: str) -> Optional[float]:
+        if not self.persistent:
+            return None
+        db = next(get_db())
+        try:
+            entry = PriceCacheDAO.get(
+                db, key, datetime.utcnow() - timedelta(seconds=self.db_ttl)
+            )
+            return float(entry.price) if entry else None
+        except Exception as e:
+            logger.warning(f"Price cache lookup failed: {e}")
+            return None
+        finally:
+            db.close()
+
+    def _record_hit(self, tier: str):
+        PRICE_CACHE_LOOKUPS.labels(tier).inc()
+        self.saved_seconds += self._api_seconds
+        PRICE_CACHE_SAVED_SECONDS.inc(self._api_seconds)
+
+    async def get(self, key: str) -> Optional[float]:
+        """查询缓存，先内存后数据库；数据库命中时回填内存"""
+        if (self.hits_memory + self.hits_db + self.misses + 1) % 1000 == 0:
+            logger.info(f"Price cache stats: {self.stats()}")
+
+        price = self._get_memory(key)
+        if price is not None:
+            self.hits_memory += 1
+            self._record_hit("memory")
+            return price
+
+        price = await asyncio.to_thread(self._get_db, key) if self.persistent else None
+        if price is not None:
+            self.hits_db += 1
+            self._record_hit("db")
+            self._put_memory(key, price)
+            return price
+
+        self.misses += 1
+        PRICE_CACHE_LOOKUPS.labels("miss").inc()
+        return None
+
+    async def put(self, key: str, price: float, api_seconds: float = 0.0):
+        """写入两级缓存，并记录本次估价API耗时"""
+        if api_seconds:
+            self._api_seconds = (
+                api_seconds
+                if not self._api_seconds
+                else 0.2 * api_seconds + 0.8 * self._api_seconds
+            )
+        self._put_memory(key, price)
+        if self.persistent:
+            await asyncio.to_thread(self._put_db, key, price)
+
+    def _put_db(self, key: str, price: float):
+        db = next(get_db())
+        try:
+            PriceCacheDAO.save(db, key, self.model_version, price)
+        except Exception as e:
+            logger.warning(f"Price cache write failed: {e}")
+        finally:
+            db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """命中率与节省的估价API时间"""
+        lookups = self.hits_memory + self.hits_db + self.misses
+        return {
+            "lookups": lookups,
+            "hits_memory": self.hits_memory,
+            "hits_db": self.hits_db,
+            "misses": self.misses,
+            "hit_ratio": (self.hits_memory + self.hits_db) / lookups if lookups else 0,
+            "saved_api_seconds": round(self.saved_seconds, 3),
+        }
@@ -0,0 +1,249 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.providers.rpc import AsyncHTTPProvider
+
+logger = logging.getLogger(__name__)
+
+# 需要广播到多个节点的写操作
+WRITE_METHODS = {"eth_sendRawTransaction"}
+
+# 视为节点故障（而非调用本身出错）的JSON-RPC错误
+RATE_LIMIT_CODES = {-32005, 429}
+RATE_LIMIT_MARKERS = ("rate limit", "too many requests", "limit exceeded")
+
+# 这些方法返回的错误由请求本身决定（如 eth_getLogs 区间过大也使用 -32005），
+# 换节点重试只会得到同样的错误，原样返回给调用方
+REQUEST_ERROR_METHODS = {"eth_getLogs"}
+# 区间过大/结果过多一类的错误属于请求错误，不计为节点故障
+REQUEST_ERROR_MARKERS = (
+    "query returned more than",
+    "more than 10000 results",
+    "block range",
+    "range too large",
+    "too many blocks",
+    "response size exceeded",
+)
+
+
+class RPCEndpoint:
+    """单个RPC节点及其近期延迟、错误率的EWMA统计"""
+
+    def __init__(self, url: str, request_kwargs: Dict[str, Any], alpha: float):
+        self.url = url
+        self.alpha = alpha
+        self.provider = AsyncHTTPProvider(
+            url, request_kwargs=request_kwargs, exception_retry_configuration=None
+        )
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected = False
+
+    @property
+    def score(self) -> float:
+        """越小越好：延迟按错误率放大"""
+        return self.latency / max(1 - self.error_rate, 0.05)
+
+    def record_success(self, elapsed: float):
+        self.latency = elapsed if not self.latency else (
+            self.alpha * elapsed + (1 - self.alpha) * self.latency
+        )
+        self.error_rate = (1 - self.alpha) * self.error_rate
+        self.consecutive_failures = 0
+
+    def record_failure(self):
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+        self.consecutive_failures += 1
+
+
+class RPCEndpointPool(AsyncJSONBaseProvider):
+    """
+    多RPC节点的异步provider，可直接交给 AsyncWeb3 使用。
+    - 读请求发往近期延迟与错误率（EWMA）最优的节点，失败时依次尝试下一个
+    - 连续失败或错误率过高的节点被摘除，后台按指数退避重新探测，恢复后重新加入
+    - 交易广播到多个健康节点，返回最先成功的响应
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        request_kwargs: Optional[Dict[str, Any]] = None,
+        alpha: float = 0.3,
+        max_consecutive_failures: int = 3,
+        max_error_rate: float = 0.5,
+        eject_seconds: float = 5,
+        max_eject_seconds: float = 300,
+        broadcast_count: int = 3,
+    ):
+        super().__init__()
+        if not urls:
+            raise ValueError("RPC节点列表不能为空")
+        self.endpoints = [
+            RPCEndpoint(url, request_kwargs or {}, alpha) for url in urls
+        ]
+        self.max_consecutive_failures = max_consecutive_failures
+        self.max_error_rate = max_error_rate
+        self.eject_seconds = eject_seconds
+        self.max_eject_seconds = max_eject_seconds
+        self.broadcast_count = max(1, broadcast_count)
+        self._background: Set[asyncio.Task] = set()
+
+    def __str__(self) -> str:
+        return f"RPC endpoint pool {[endpoint.url for endpoint in self.endpoints]}"
+
+    async def cache_async_session(self, session: aiohttp.ClientSession):
+        """所有节点共享同一个连接池会话"""
+        for endpoint in self.endpoints:
+            await endpoint.provider.cache_async_session(session)
+
+    def _ranked(self) -> List[RPCEndpoint]:
+        healthy = sorted(
+            (endpoint for endpoint in self.endpoints if not endpoint.ejected),
+            key=lambda endpoint: endpoint.score,
+        )
+        # 全部被摘除时仍按得分尝试，避免彻底不可用
+        return healthy or sorted(self.endpoints, key=lambda endpoint: endpoint.score)
+
+    @staticmethod
+    def _is_endpoint_error(method: str, response: Dict[str, Any]) -> bool:
+        error = response.get("error")
+        if not isinstance(error, dict) or method in REQUEST_ERROR_METHODS:
+            return False
+        message = str(error.get("message", "")).lower()
+        if any(marker in message for marker in REQUEST_ERROR_MARKERS):
+            return False
+        return error.get("code") in RATE_LIMIT_CODES or any(
+            marker in message for marker in RATE_LIMIT_MARKERS
+        )
+
+    async def _call(self, endpoint: RPCEndpoint, method: str, params: Any) -> Any:
+        started = time.monotonic()
+        try:
+            response = await endpoint.provider.make_request(method, params)
+        except Exception:
+            self._on_failure(endpoint)
+            raise
+
+        if self._is_endpoint_error(method, response):
+            self._on_failure(endpoint)
+            raise ConnectionError(f"{endpoint.url} rate limited: {response['error']}")
+
+        endpoint.record_success(time.monotonic() - started)
+        return response
+
+    def _on_failure(self, endpoint: RPCEndpoint):
+        endpoint.record_failure()
+        if endpoint.ejected:
+            return
+        if (
+            endpoint.consecutive_failures >= self.max_consecutive_failures
+            or endpoint.error_rate > self.max_error_rate
+        ):
+            self._eject(endpoint)
+
+    def _eject(self, endpoint: RPCEndpoint):
+        endpoint.ejected = True
+        endpoint.ejections += 1
+        delay = min(
+            self.eject_seconds * 2 ** (endpoint.ejections - 1), self.max_eject_seconds
+        )
+        logger.warning(f"Ejecting RPC endpoint {endpoint.url} for {delay:.1f}s")
+        self._spawn(self._reprobe(endpoint, delay))
+
+    async def _reprobe(self, endpoint: RPCEndpoint, delay: float):
+        await asyncio.sleep(delay)
+        started = time.monotonic()
+        try:
+            response = await endpoint.provider.make_request("eth_blockNumber", [])
+            if "result" not in response:
+                raise ConnectionError(response.get("error"))
+        except Exception as e:
+            logger.info(f"RPC endpoint {endpoint.url} still unhealthy: {e}")
+            endpoint.ejected = False
+            self._eject(endpoint)
+            return
+
+        endpoint.error_rate = 0.0
+        endpoint.consecutive_failures = 0
+        endpoint.ejections = 0
+        endpoint.latency = time.monotonic() - started
+        endpoint.ejected = False
+        logger.info(f"RPC endpoint {endpoint.url} reinstated")
+
+    def _spawn(self, coro: Any) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._reap)
+        return task
+
+    def _reap(self, task: asyncio.Task):
+        # 广播中未被采用的响应可能以异常结束，在此取出以免产生未处理告警
+        self._background.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def make_request(self, method: str, params: Any) -> Any:
+        if method in WRITE_METHODS:
+            return await self._broadcast(method, params)
+
+        last_error: Optional[Exception] = None
+        for endpoint in self._ranked():
+            try:
+                return await self._call(endpoint, method, params)
+            except Exception as e:
+                logger.debug(f"RPC {method} failed on {endpoint.url}: {e}")
+                last_error = e
+        raise last_error
+
+    async def make_batch_request(self, batch_requests: List[Tuple[str, Any]]) -> Any:
+        """批量请求整体发往最优节点，失败时依次尝试下一个"""
+        last_error: Optional[Exception] = None
+        for endpoint in self._ranked():
+            started = time.monotonic()
+            try:
+                responses = await endpoint.provider.make_batch_request(batch_requests)
+            except Exception as e:
+                self._on_failure(endpoint)
+                logger.debug(f"RPC batch failed on {endpoint.url}: {e}")
+                last_error = e
+                continue
+            endpoint.record_success(time.monotonic() - started)
+            return responses
+        raise last_error
+
+    async def _broadcast(self, method: str, params: Any) -> Any:
+        """广播写请求，返回第一个成功的响应；全部失败时返回首个错误响应"""
+        targets = self._ranked()[: self.broadcast_count]
+        tasks = [self._spawn(self._call(endpoint, method, params)) for endpoint in targets]
+
+        error_response = None
+        last_error: Optional[Exception] = None
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                response = await next_done
+            except Exception as e:
+                last_error = e
+                continue
+            if "result" in response:
+                return response
+            error_response = error_response or response
+
+        if error_response is not None:
+            return error_response
+        raise last_error
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        for endpoint in self._ranked():
+            if await endpoint.provider.is_connected(show_traceback=show_traceback):
+                return True
+        return False
+
+    async def disconnect(self):
+        for task in list(self._background):
+            task.cancel()
@@ -0,0 +1,28 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """
+    合并同一键的并发调用：进行中的调用只执行一次，其余调用方等待同一结果。
+    - 调用在独立任务中执行，单个调用方被取消不会影响其他等待者
+    - 调用结束（成功或失败）后立即移除，下一次调用重新执行
+    - 传入 counter（如 Prometheus Counter）时，每次被合并的调用计数一次
+    """
+
+    def __init__(self, counter: Optional[Any] = None):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.counter = counter
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        elif self.counter is not None:
+            self.counter.inc()
+        return await asyncio.shield(task)
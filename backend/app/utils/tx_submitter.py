@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3 import AsyncWeb3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TransactionNotFound
+
+logger = logging.getLogger(__name__)
+
+
+class NonceAllocator:
+    """
+    本地nonce分配器。
+    - 首次使用时从链上读取 pending nonce，此后在本地递增
+    - 遇到 "nonce too low" 或发送失败时重新与链上同步
+    """
+
+    def __init__(self, w3: AsyncWeb3, address: str):
+        self.w3 = w3
+        self.address = address
+        self._next_nonce: Optional[int] = None
+
+    @property
+    def synced(self) -> bool:
+        return self._next_nonce is not None
+
+    async def resync(self):
+        self.set(await self.w3.eth.get_transaction_count(self.address, "pending"))
+
+    def set(self, nonce: int):
+        """写入链上 pending nonce（来自同步或批量RPC请求）"""
+        self._next_nonce = nonce
+        logger.info(f"Nonce for {self.address} resynced to {self._next_nonce}")
+
+    async def allocate(self) -> int:
+        if self._next_nonce is None:
+            await self.resync()
+        nonce = self._next_nonce
+        self._next_nonce += 1
+        return nonce
+
+
+class TransactionSubmitter:
+    """
+    流水线式交易提交器，由各链的异步客户端共享使用。
+    - 本地分配nonce，多笔交易可以连续发送而无需等待上一笔上链
+    - 后台跟踪任务将待确认交易的回执查询打包为一个 JSON-RPC 批量请求，并通过 Future 通知调用方
+    - 待确认交易超过单批上限时轮流查询，较新的交易不必等待较早的交易确认或超时
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        account: Any,
+        poll_interval: float = 1.0,
+        batch_size: int = 50,
+        receipt_timeout: float = 120,
+    ):
+        self.w3 = w3
+        self.account = account
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.receipt_timeout = receipt_timeout
+        self.nonces = NonceAllocator(w3, account.address)
+        self._send_lock = asyncio.Lock()
+        self._pending: Dict[bytes, Tuple[asyncio.Future, float]] = {}
+        self._poll_offset = 0
+        self._tracker: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        """等待回执的交易数"""
+        return len(self._pending)
+
+    async def _sign_and_send(self, transaction: Dict[str, Any]) -> bytes:
+        transaction["nonce"] = await self.nonces.allocate()
+        signed_txn = self.account.sign_transaction(transaction)
+        return await self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+
+    async def send(self, transaction: Dict[str, Any]) -> Tuple[bytes, asyncio.Future]:
+        """
+        签名并发送交易，不等待回执。
+
+        Args:
+            transaction: 已构建的交易字段，nonce 由提交器填写
+
+        Returns:
+            (交易哈希, 回执 Future)
+        """
+        async with self._send_lock:
+            try:
+                tx_hash = await self._sign_and_send(transaction)
+            except Exception as e:
+                # nonce 失配或发送失败都可能留下空洞，重新同步后再试一次
+                await self.nonces.resync()
+                if "nonce too low" not in str(e).lower():
+                    raise
+                tx_hash = await self._sign_and_send(transaction)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[bytes(tx_hash)] = (future, time.monotonic())
+        self._ensure_tracker()
+        return tx_hash, future
+
+    async def submit(self, transaction: Dict[str, Any]) -> Tuple[bytes, Any]:
+        """发送交易并等待其回执"""
+        tx_hash, future = await self.send(transaction)
+        return tx_hash, await future
+
+    def _ensure_tracker(self):
+        if self._tracker is None or self._tracker.done():
+            self._tracker = asyncio.create_task(self._track_receipts())
+
+    async def _fetch_receipt(self, tx_hash: bytes) -> Optional[Any]:
+        try:
+            return await self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    async def _fetch_receipts(self, hashes: List[bytes]) -> List[Any]:
+        """
+        一次 JSON-RPC 批量请求取回多笔交易的回执，未上链的交易对应 None。
+        - 直接走 provider 的批量接口：web3 的批量请求遇到任一空结果会整体抛出 TransactionNotFound
+        - 节点不支持批量请求时退回为逐个查询
+        """
+        try:
+            responses = await self.w3.provider.make_batch_request(
+                [
+                    ("eth_getTransactionReceipt", ["0x" + tx_hash.hex()])
+                    for tx_hash in hashes
+                ]
+            )
+            if not isinstance(responses, list) or len(responses) != len(hashes):
+                raise ValueError(f"Unexpected batch response: {responses}")
+        except Exception as e:
+            logger.debug(f"Receipt batch request failed, falling back: {e}")
+            return await asyncio.gather(
+                *(self._fetch_receipt(tx_hash) for tx_hash in hashes),
+                return_exceptions=True,
+            )
+
+        receipts: List[Any] = []
+        for response in responses:
+            result = response.get("result")
+            if "error" in response:
+                receipts.append(ValueError(response["error"]))
+            elif result is None:
+                receipts.append(None)
+            else:
+                receipts.append(AttributeDict.recursive(receipt_formatter(result)))
+        return receipts
+
+    def _next_batch(self) -> List[bytes]:
+        """按轮转顺序取出本轮要查询的交易哈希"""
+        hashes = list(self._pending)
+        if len(hashes) <= self.batch_size:
+            return hashes
+        start = self._poll_offset % len(hashes)
+        self._poll_offset = start + self.batch_size
+        return (hashes[start:] + hashes[:start])[: self.batch_size]
+
+    async def _track_receipts(self):
+        """批量轮询待确认交易的回执，直到没有待确认交易"""
+        while self._pending:
+            await asyncio.sleep(self.poll_interval)
+            hashes = self._next_batch()
+            receipts = await self._fetch_receipts(hashes)
+
+            now = time.monotonic()
+            for tx_hash, receipt in zip(hashes, receipts):
+                future, submitted_at = self._pending[tx_hash]
+                if isinstance(receipt, Exception) or receipt is None:
+                    if now - submitted_at < self.receipt_timeout:
+                        continue
+                    self._pending.pop(tx_hash)
+                    if not future.done():
+                        future.set_exception(
+                            asyncio.TimeoutError(
+                                f"Transaction 0x{tx_hash.hex()} not mined "
+                                f"after {self.receipt_timeout}s"
+                            )
+                        )
+                    continue
+
+                self._pending.pop(tx_hash)
+                if not future.done():
+                    future.set_result(receipt)
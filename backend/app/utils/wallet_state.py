@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from web3 import AsyncWeb3
+
+logger = logging.getLogger(__name__)
+
+
+class WalletState:
+    """
+    热钱包余额的本地账本，由各链异步客户端共享使用。
+    - 提交交易前按最高手续费预留额度，回执返回后按实际花费扣减，无需每笔交易查询余额
+    - 定期在后台与链上余额对账
+    - 可用余额低于阈值时告警并暂停提交，直到对账确认余额已补足
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        address: str,
+        low_balance_wei: int = 0,
+        reconcile_interval: float = 60,
+    ):
+        self.w3 = w3
+        self.address = address
+        self.low_balance_wei = low_balance_wei
+        self.reconcile_interval = reconcile_interval
+        self._balance: Optional[int] = None
+        self._reserved = 0
+        self._reconciled_at = 0.0
+        self._reconciling: Optional[asyncio.Task] = None
+        self.paused = False
+
+    @property
+    def available(self) -> int:
+        """本地估算的可用余额（链上余额减去在途交易预留）"""
+        return (self._balance or 0) - self._reserved
+
+    @property
+    def needs_balance(self) -> bool:
+        """尚未读取过链上余额"""
+        return self._balance is None
+
+    async def reconcile(self):
+        """与链上余额对账"""
+        self.set_balance(await self.w3.eth.get_balance(self.address))
+
+    def set_balance(self, balance: int):
+        """写入链上余额（来自对账或批量RPC请求）"""
+        self._balance = balance
+        self._reconciled_at = time.monotonic()
+        self._update_paused()
+
+    def _update_paused(self):
+        paused = self.available < self.low_balance_wei
+        if paused and not self.paused:
+            logger.warning(
+                f"Wallet {self.address} balance low "
+                f"({self.w3.from_wei(self.available, 'ether')} available), "
+                f"pausing submissions"
+            )
+        elif not paused and self.paused:
+            logger.info(f"Wallet {self.address} balance restored, resuming")
+        self.paused = paused
+
+    def _maybe_reconcile(self):
+        if time.monotonic() - self._reconciled_at < self.reconcile_interval:
+            return
+        if self._reconciling is None or self._reconciling.done():
+            self._reconciling = asyncio.create_task(self._reconcile_quietly())
+
+    async def _reconcile_quietly(self):
+        try:
+            await self.reconcile()
+        except Exception as e:
+            logger.warning(f"Wallet reconcile failed: {e}")
+
+    async def reserve(self, cost_wei: int) -> bool:
+        """
+        为一笔交易预留最高花费
+
+        Returns:
+            True 表示可以提交；余额不足或已暂停时返回 False
+        """
+        if self._balance is None:
+            await self.reconcile()
+        else:
+            self._maybe_reconcile()
+
+        if self.paused or self.available < cost_wei:
+            return False
+
+        self._reserved += cost_wei
+        self._update_paused()
+        return True
+
+    def release(self, cost_wei: int):
+        """交易未发送成功时释放预留额度"""
+        self._reserved -= cost_wei
+        self._update_paused()
+
+    def settle(self, cost_wei: int, receipt: Any):
+        """交易上链后释放预留额度，并按实际gas花费扣减余额"""
+        self._reserved -= cost_wei
+        spent = receipt.gasUsed * receipt.get("effectiveGasPrice", 0)
+        self._balance = (self._balance or 0) - spent
+        self._update_paused()
+        self._maybe_reconcile()
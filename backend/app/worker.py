@@ -0,0 +1,55 @@
+"""
+链上事件同步worker，独立于API服务运行：
+
+    python -m app.worker
+
+只负责事件同步与定价交易提交，API进程可以单独水平扩展。
+"""
+
+import asyncio
+import logging
+import signal
+
+from prometheus_client import start_http_server
+
+from app.config import settings
+from app.database import create_tables, test_connection
+from app.utils.chain_ingestor import ingest_supervisor
+from app.utils.contract_registry import contract_registry
+from app.utils.evaluate import pricing_batcher, pricing_client
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def run():
+    """启动多链同步，收到 SIGINT/SIGTERM 后优雅退出"""
+    if not test_connection():
+        raise RuntimeError("Failed to connect to database!")
+    create_tables()
+    contract_registry.load()
+    await pricing_client.start()
+
+    if settings.WORKER_METRICS_PORT:
+        start_http_server(settings.WORKER_METRICS_PORT)
+        logger.info(f"Worker metrics on :{settings.WORKER_METRICS_PORT}/metrics")
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    ingest_supervisor.start()
+    logger.info("Ingest worker started")
+    try:
+        await stop_event.wait()
+    finally:
+        logger.info("Shutting down ingest worker...")
+        await ingest_supervisor.stop()
+        await pricing_batcher.close()
+        await pricing_client.close()
+        logger.info("Ingest worker stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -1,12 +1,15 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import auth, nft, nft_polkadot
+from app.routers import admin, auth, nft, nft_polkadot
+from app.config import settings
 from app.database import create_tables, test_connection
-from app.utils.event_listener import event_listener
-from app.utils.polkadot_listener import polkadot_event_listener
+from app.utils.chain_ingestor import ingest_supervisor
+from app.utils.contract_registry import contract_registry
+from app.utils.evaluate import pricing_batcher, pricing_client
+
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 import uvicorn
-import asyncio
 
 
 # 创建FastAPI应用实例
@@ -32,24 +35,26 @@ async def startup_event():
     else:
         print("Failed to connect to database!")
 
-    # 启动事件监听器
-    try:
-        event_listener.initialize()
-        polkadot_event_listener.initialize()
-        asyncio.create_task(event_listener.start_listening())
-        asyncio.create_task(polkadot_event_listener.start_listening())
+    # 一次性加载并校验全部合约ABI，格式错误时尽早失败
+    contract_registry.load()
+    await pricing_client.start()
+
+    # 事件同步默认由独立worker（python -m app.worker）运行；
+    # 仅在单进程部署时通过 RUN_INGEST_IN_API 在API进程内启动
+    if settings.RUN_INGEST_IN_API:
+        ingest_supervisor.start()
         print("Event listener started successfully!")
-    except Exception as e:
-        print(f"Failed to start event listener: {e}")
 
 
 # 关闭时停止事件监听器
 @app.on_event("shutdown")
 async def shutdown_event():
     print("Shutting down MoonCL Server...")
-    event_listener.stop_listening()
-    polkadot_event_listener.stop_listening()
-    print("Event listener stopped")
+    if settings.RUN_INGEST_IN_API:
+        await ingest_supervisor.stop()
+        print("Event listener stopped")
+    await pricing_batcher.close()
+    await pricing_client.close()
 
 
 # 注册路由 - 移除opinion路由
@@ -58,6 +63,7 @@ app.include_router(nft.router, prefix="/api/v1/nfts", tags=["nfts"])
 app.include_router(
     nft_polkadot.router, prefix="/api/v1/nfts/polkadot", tags=["nfts_polkadot"]
 )
+app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
 
 
 # 根路径
@@ -72,5 +78,11 @@ def health_check():
     return {"status": "healthy"}
 
 
+# Prometheus 指标端点
+@app.get("/metrics")
+def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
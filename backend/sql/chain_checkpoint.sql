@@ -0,0 +1,10 @@
+-- 链上事件同步检查点表
+DROP TABLE IF EXISTS `chain_checkpoint`;
+CREATE TABLE `chain_checkpoint` (
+  `chain` varchar(64) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '链标识',
+  `contract_address` varchar(255) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '合约地址',
+  `last_block` bigint NOT NULL COMMENT '最后已处理区块',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
+  PRIMARY KEY (`chain`, `contract_address`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='事件同步检查点表';
@@ -0,0 +1,20 @@
+-- 处理失败的链上事件（死信队列）表
+DROP TABLE IF EXISTS `dead_letter_event`;
+CREATE TABLE `dead_letter_event` (
+  `id` bigint NOT NULL AUTO_INCREMENT COMMENT '主键',
+  `chain` varchar(64) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '链标识',
+  `tx_hash` varchar(66) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '交易哈希',
+  `log_index` int NOT NULL COMMENT '日志序号',
+  `block_number` bigint NOT NULL COMMENT '区块号',
+  `event_name` varchar(64) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '事件名',
+  `payload` text COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '事件数据(JSON)',
+  `error` text COLLATE utf8mb4_unicode_ci COMMENT '最近一次错误',
+  `attempts` int NOT NULL DEFAULT '0' COMMENT '已重试次数',
+  `status` varchar(16) COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'pending' COMMENT '状态: pending/resolved/exhausted',
+  `next_retry_at` datetime NOT NULL COMMENT '下次重试时间',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+  `updated_at` timestamp NULL DEFAULT NULL ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `uk_chain_tx_log` (`chain`, `tx_hash`, `log_index`),
+  KEY `idx_status_next_retry` (`status`, `next_retry_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='死信事件表';
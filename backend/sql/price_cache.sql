@@ -0,0 +1,11 @@
+-- 内容估价缓存表
+DROP TABLE IF EXISTS `price_cache`;
+CREATE TABLE `price_cache` (
+  `content_hash` varchar(64) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '规范化内容与估价模型版本的SHA-256',
+  `model_version` varchar(32) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '估价模型版本',
+  `price` decimal(20,12) NOT NULL COMMENT '估价结果(ETH)',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
+  PRIMARY KEY (`content_hash`),
+  KEY `idx_created_at` (`created_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='内容估价缓存表';
@@ -0,0 +1,11 @@
+-- 已处理链上事件台账表
+DROP TABLE IF EXISTS `processed_event`;
+CREATE TABLE `processed_event` (
+  `chain` varchar(64) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '链标识',
+  `tx_hash` varchar(66) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '交易哈希',
+  `log_index` int NOT NULL COMMENT '日志序号',
+  `block_number` bigint NOT NULL COMMENT '区块号',
+  `event_name` varchar(64) COLLATE utf8mb4_unicode_ci NOT NULL COMMENT '事件名',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '处理时间',
+  PRIMARY KEY (`chain`, `tx_hash`, `log_index`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='已处理事件台账表';
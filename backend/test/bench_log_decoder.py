@@ -0,0 +1,79 @@
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from app.utils.log_decoder import LogDecoderRegistry
+
+CONTRACTS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "contracts"
+)
+NFT_ADDRESS = Web3.to_checksum_address("0x" + "11" * 20)
+
+
+def _make_logs(topic: bytes, count: int, content_size: int):
+    """构造带长 content 字符串的 Minted 原始日志"""
+    content = ("AI 文本 NFT benchmark content. " * content_size)[:content_size]
+    logs = []
+    for i in range(count):
+        minter = "0x" + f"{i % 997:040x}"
+        logs.append(
+            {
+                "address": NFT_ADDRESS,
+                "topics": [
+                    HexBytes(topic),
+                    HexBytes(i.to_bytes(32, "big")),
+                    HexBytes(bytes(12) + bytes.fromhex(minter[2:])),
+                ],
+                "data": HexBytes(encode(["string"], [f"{i}:{content}"])),
+                "blockNumber": 1000 + i // 10,
+                "blockHash": HexBytes(b"\x01" * 32),
+                "transactionHash": HexBytes(i.to_bytes(32, "big")),
+                "transactionIndex": i % 10,
+                "logIndex": i % 10,
+            }
+        )
+    return logs
+
+
+def _rate(decode, logs) -> float:
+    started = time.perf_counter()
+    for log in logs:
+        decode(log)
+    return len(logs) / (time.perf_counter() - started)
+
+
+def main(count: int = 20000, content_size: int = 2000):
+    with open(os.path.join(CONTRACTS_DIR, "AiTextNFT.json"), "r") as f:
+        abi = json.load(f)
+
+    web3_event = Web3().eth.contract(address=NFT_ADDRESS, abi=abi).events.Minted()
+    registry = LogDecoderRegistry.from_abi_files(os.path.join(CONTRACTS_DIR, "*.json"))
+    topic = Web3.keccak(text="Minted(uint256,address,string)")
+    fast_decoder = registry.get(topic)
+    logs = _make_logs(topic, count, content_size)
+
+    # 结果一致性校验
+    for log in logs[:100]:
+        expected = web3_event.process_log(log)
+        actual = fast_decoder.process_log(log)
+        assert dict(expected["args"]) == actual["args"], (expected, actual)
+        assert expected["logIndex"] == actual["logIndex"]
+
+    web3_rate = _rate(web3_event.process_log, logs)
+    fast_rate = _rate(fast_decoder.process_log, logs)
+
+    print(f"日志数: {count}, content长度: {content_size}")
+    print(f"web3 process_log: {web3_rate:,.0f} events/s")
+    print(f"快速解码器:       {fast_rate:,.0f} events/s")
+    print(f"加速比: {fast_rate / web3_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
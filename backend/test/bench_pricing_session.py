@@ -0,0 +1,102 @@
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiohttp
+from aiohttp import web
+
+from app.utils.evaluate import PricingClient
+
+
+class StubPricingServer:
+    """本地替身估价服务"""
+
+    def __init__(self):
+        self.runner = None
+        self.port = None
+        self.requests = 0
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.port}/"
+
+    async def _handle(self, request):
+        payload = await request.json()
+        self.requests += 1
+        return web.json_response({"price": 0.01 + len(payload["content"]) / 1e6})
+
+
+async def _price_with_new_session(url: str, content: str):
+    """改造前的行为：每次调用新建会话"""
+    async with aiohttp.ClientSession() as session:
+        async with session.post(
+            url,
+            json={"content": content},
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            return (await response.json())["price"]
+
+
+async def _measure(price, count: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await price(f"bench content {i}")
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(count)))
+    return latencies, time.perf_counter() - started
+
+
+def _report(label: str, latencies, elapsed: float):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{label}: p50 {p50:.2f}ms, p99 {p99:.2f}ms, "
+        f"{len(latencies) / elapsed:,.0f} req/s"
+    )
+
+
+async def main(count: int = 2000, concurrency: int = 20):
+    async with StubPricingServer() as server:
+        latencies, elapsed = await _measure(
+            lambda content: _price_with_new_session(server.url, content),
+            count,
+            concurrency,
+        )
+        _report("每次新建会话", latencies, elapsed)
+
+        client = PricingClient(url=server.url, pool_size=concurrency)
+        await client.start()
+        try:
+            latencies, elapsed = await _measure(client.price, count, concurrency)
+        finally:
+            await client.close()
+        _report("共享长连接会话", latencies, elapsed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.evaluate import (
+    calculate_price_traditional,
+    calculate_price_traditional_batch,
+)
+
+# 覆盖 ASCII、标点、全角与不间断空白、中日文、变音符号、emoji 与孤立代理码点
+ALPHABET = (
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    " \t\n\r\x0b\x0c　  "
+    "!@#$%^&*()_+-=[]{};':\",./<>?`~，。！？、《》“”"
+    "月之暗面链上估价ひらがなカタカナ한국어"
+    "éüñ́٣²Ⅷ"
+    "😀🚀🌕🧪\ud800"
+)
+
+
+def _synthetic_texts(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    texts = []
+    for i in range(count):
+        if i % 100 == 0:
+            texts.append("")
+            continue
+        length = int(rng.expovariate(1 / 120)) + 1
+        texts.append("".join(rng.choices(ALPHABET, k=length)))
+    return texts
+
+
+def main(count: int = 100_000):
+    texts = _synthetic_texts(count)
+
+    started = time.perf_counter()
+    expected = [calculate_price_traditional(text) for text in texts]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = calculate_price_traditional_batch(texts)
+    batch_seconds = time.perf_counter() - started
+
+    mismatches = [i for i, (a, b) in enumerate(zip(expected, actual)) if a != b]
+    assert len(actual) == len(expected) and not mismatches, mismatches[:10]
+
+    print(f"逐条估价: {scalar_seconds * 1000:.1f}ms")
+    print(f"批量估价: {batch_seconds * 1000:.1f}ms")
+    print(f"加速比: {scalar_seconds / batch_seconds:.1f}x，{count:,} 条结果完全一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import settings
+from app.models import PriceCacheDB
+from app.utils import price_cache as price_cache_module
+from app.utils.evaluate import content_hash
+from app.utils.price_cache import PriceCache
+
+
+class StandInDatabase:
+    """用内存SQLite替身替换价格缓存使用的数据库会话"""
+
+    def __enter__(self):
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        PriceCacheDB.__table__.create(engine)
+        self.Session = sessionmaker(bind=engine)
+        self._get_db = price_cache_module.get_db
+        price_cache_module.get_db = self.get_db
+        return self
+
+    def __exit__(self, *exc):
+        price_cache_module.get_db = self._get_db
+
+    def get_db(self):
+        db = self.Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def count(self) -> int:
+        db = self.Session()
+        try:
+            return db.query(PriceCacheDB).count()
+        finally:
+            db.close()
+
+
+async def _test_lru_eviction():
+    cache = PriceCache("test", max_items=2, persistent=False)
+    await cache.put("a", 0.1)
+    await cache.put("b", 0.2)
+    # 访问 a 后 b 成为最久未使用的条目
+    assert await cache.get("a") == 0.1
+    await cache.put("c", 0.3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 0.1
+    assert await cache.get("c") == 0.3
+    assert cache.stats()["misses"] == 1
+
+
+async def _test_db_fallback_on_memory_miss():
+    with StandInDatabase() as database:
+        writer = PriceCache("test")
+        await writer.put("shared", 0.42)
+        assert database.count() == 1
+
+        # 新进程（空的内存缓存）从数据库命中并回填内存
+        reader = PriceCache("test")
+        assert await reader.get("shared") == 0.42
+        assert reader.hits_db == 1
+        assert await reader.get("shared") == 0.42
+        assert reader.hits_memory == 1
+
+        assert await reader.get("unknown") is None
+        assert reader.misses == 1
+
+        # 超过数据库TTL的条目视为未命中
+        expired = PriceCache("test", db_ttl=-1)
+        assert await expired.get("shared") is None
+
+
+async def _test_keyed_by_model_version():
+    original = settings.PRICING_MODEL_VERSION
+    try:
+        settings.PRICING_MODEL_VERSION = "v1"
+        old_key = content_hash("some  content")
+        assert old_key == content_hash(" some content ")
+
+        settings.PRICING_MODEL_VERSION = "v2"
+        new_key = content_hash("some content")
+    finally:
+        settings.PRICING_MODEL_VERSION = original
+    assert old_key != new_key
+
+    with StandInDatabase():
+        await PriceCache("v1").put(old_key, 0.5)
+        # 估价模型升级后旧版本的缓存不再命中
+        cache = PriceCache("v2")
+        assert await cache.get(new_key) is None
+        assert await cache.get(old_key) == 0.5
+
+
+def test_lru_eviction():
+    asyncio.run(_test_lru_eviction())
+
+
+def test_db_fallback_on_memory_miss():
+    asyncio.run(_test_db_fallback_on_memory_miss())
+
+
+def test_keyed_by_model_version():
+    asyncio.run(_test_keyed_by_model_version())
+
+
+if __name__ == "__main__":
+    print("🚀 开始测试估价缓存...")
+    test_lru_eviction()
+    test_db_fallback_on_memory_miss()
+    test_keyed_by_model_version()
+    print("✅ 测试通过")
@@ -0,0 +1,208 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+
+from app.utils.evaluate import (
+    PricingBatcher,
+    PricingClient,
+    calculate_price_traditional,
+)
+
+
+def _price_of(content: str) -> float:
+    return 0.01 + len(content) / 1e6
+
+
+class BatchPricingServer:
+    """本地替身估价服务：/ 逐条估价，/batch 批量估价，可切换批量接口的故障模式"""
+
+    def __init__(self):
+        self.runner = None
+        self.port = None
+        # None: 正常；"error": 返回500；"malformed": 返回200但格式不符；"hang": 超时不响应
+        self.batch_mode = None
+        # 逐条估价接口是否返回500
+        self.single_failing = False
+        self.single_requests = 0
+        self.batch_sizes = []
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/", self._handle_single)
+        app.router.add_post("/batch", self._handle_batch)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.port}/"
+
+    @property
+    def batch_url(self) -> str:
+        return f"http://localhost:{self.port}/batch"
+
+    async def _handle_single(self, request):
+        payload = await request.json()
+        self.single_requests += 1
+        if self.single_failing:
+            return web.Response(status=500)
+        return web.json_response({"price": _price_of(payload["content"])})
+
+    async def _handle_batch(self, request):
+        payload = await request.json()
+        self.batch_sizes.append(len(payload["contents"]))
+        if self.batch_mode == "hang":
+            await asyncio.sleep(1)
+        if self.batch_mode == "error":
+            return web.Response(status=500)
+        if self.batch_mode == "malformed":
+            return web.json_response({"results": []})
+        return web.json_response(
+            {"prices": [_price_of(content) for content in payload["contents"]]}
+        )
+
+
+async def _price_all(batcher: PricingBatcher, contents):
+    results = await asyncio.gather(*(batcher.price(content) for content in contents))
+    assert all(from_api for _, from_api in results), results
+    return [price for price, _ in results]
+
+
+async def _test_batch_fan_out():
+    async with BatchPricingServer() as server:
+        client = PricingClient(url=server.url, batch_url=server.batch_url)
+        batcher = PricingBatcher(client, window=0.05, max_items=8)
+        try:
+            contents = [f"content {i}" * (i + 1) for i in range(20)]
+            prices = await _price_all(batcher, contents)
+
+            # 20 条并发请求按上限 8 拆成 8 + 8 + 4 三个批次，不发逐条请求
+            assert prices == [_price_of(content) for content in contents]
+            assert sorted(server.batch_sizes) == [4, 8, 8], server.batch_sizes
+            assert server.single_requests == 0
+        finally:
+            await client.close()
+
+
+async def _test_batch_fallback():
+    async with BatchPricingServer() as server:
+        client = PricingClient(
+            url=server.url, batch_url=server.batch_url, max_batch_failures=3
+        )
+        batcher = PricingBatcher(client, window=0.05, max_items=8)
+        try:
+            # 批量接口失败时逐条估价，结果仍然正确
+            server.batch_mode = "error"
+            contents = [f"a{i}" for i in range(4)]
+            assert await _price_all(batcher, contents) == list(
+                map(_price_of, contents)
+            )
+            assert server.single_requests == 4
+            assert client.batch_supported
+
+            # 成功的批次清零失败计数
+            server.batch_mode = None
+            await _price_all(batcher, ["b1", "b2"])
+            assert client.batch_failures == 0
+
+            # 连续三次异常响应（500 或格式不符）后停用批量接口
+            for mode in ("error", "malformed", "malformed"):
+                server.batch_mode = mode
+                contents = [f"{mode}{i}" for i in range(3)]
+                assert await _price_all(batcher, contents) == list(
+                    map(_price_of, contents)
+                )
+            assert not client.batch_supported
+            assert not batcher.enabled
+
+            # 停用后不再请求批量接口
+            batch_requests = len(server.batch_sizes)
+            single_requests = server.single_requests
+            await _price_all(batcher, ["c1", "c2", "c3"])
+            assert len(server.batch_sizes) == batch_requests
+            assert server.single_requests == single_requests + 3
+        finally:
+            await client.close()
+
+
+async def _test_hanging_batch_endpoint_is_disabled():
+    async with BatchPricingServer() as server:
+        client = PricingClient(
+            url=server.url,
+            batch_url=server.batch_url,
+            timeout=0.2,
+            max_batch_failures=2,
+        )
+        batcher = PricingBatcher(client, window=0.05, max_items=8)
+        try:
+            # 批量接口超时计为失败，连续两次后停用，之后不再等待超时
+            server.batch_mode = "hang"
+            for round_ in range(2):
+                contents = [f"hang{round_}-{i}" for i in range(3)]
+                assert await _price_all(batcher, contents) == list(
+                    map(_price_of, contents)
+                )
+            assert not client.batch_supported
+
+            batch_requests = len(server.batch_sizes)
+            started = asyncio.get_running_loop().time()
+            await _price_all(batcher, ["d1", "d2"])
+            assert asyncio.get_running_loop().time() - started < 0.2
+            assert len(server.batch_sizes) == batch_requests
+        finally:
+            await client.close()
+
+
+async def _test_traditional_fallback():
+    async with BatchPricingServer() as server:
+        client = PricingClient(url=server.url, batch_url=server.batch_url)
+        batcher = PricingBatcher(client, window=0.05, max_items=8)
+        try:
+            # 批量与逐条接口都失败时，整批用传统算法兜底，并标记为非API结果
+            server.batch_mode = "error"
+            server.single_failing = True
+            contents = ["", "plain text", "特殊字符！？😀", "a b\tc"]
+            results = await asyncio.gather(
+                *(batcher.price(content) for content in contents)
+            )
+            assert results == [
+                (calculate_price_traditional(content), False) for content in contents
+            ]
+        finally:
+            await client.close()
+
+
+def test_batch_fan_out():
+    asyncio.run(_test_batch_fan_out())
+
+
+def test_batch_fallback():
+    asyncio.run(_test_batch_fallback())
+
+
+def test_hanging_batch_endpoint_is_disabled():
+    asyncio.run(_test_hanging_batch_endpoint_is_disabled())
+
+
+def test_traditional_fallback():
+    asyncio.run(_test_traditional_fallback())
+
+
+if __name__ == "__main__":
+    print("🚀 开始测试批量估价...")
+    test_batch_fan_out()
+    test_batch_fallback()
+    test_hanging_batch_endpoint_is_disabled()
+    test_traditional_fallback()
+    print("✅ 测试通过")
@@ -0,0 +1,85 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+
+from app.utils import evaluate
+from app.utils.evaluate import PricingBatcher, PricingClient, calculate_price
+from app.utils.price_cache import PriceCache
+
+
+class SlowPricingServer:
+    """本地替身估价服务，每次响应延迟一段时间以制造并发重叠"""
+
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.runner = None
+        self.port = None
+        self.requests = 0
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.port}/"
+
+    async def _handle(self, request):
+        payload = await request.json()
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        return web.json_response({"price": 0.01 + len(payload["content"]) / 1e6})
+
+
+async def _test_single_flight():
+    async with SlowPricingServer() as server:
+        client = PricingClient(url=server.url)
+        await client.start()
+        evaluate.pricing_batcher = PricingBatcher(client)
+        evaluate.price_cache = PriceCache("test", persistent=False)
+        try:
+            # 模拟两条链的监听器同时为相同内容估价
+            prices = await asyncio.gather(
+                *(calculate_price("same content") for _ in range(50)),
+                *(calculate_price("same  content ") for _ in range(50)),
+            )
+            assert server.requests == 1, server.requests
+            assert len(set(prices)) == 1
+            assert len(evaluate.pricing_flights) == 0
+
+            # 不同内容各自请求
+            await asyncio.gather(calculate_price("a"), calculate_price("b"))
+            assert server.requests == 3, server.requests
+
+            # 单个调用方被取消不影响其他等待者
+            first = asyncio.ensure_future(calculate_price("cancelled"))
+            second = asyncio.ensure_future(calculate_price("cancelled"))
+            await asyncio.sleep(0.05)
+            first.cancel()
+            assert await second == 0.01 + len("cancelled") / 1e6
+            assert server.requests == 4, server.requests
+        finally:
+            await client.close()
+
+
+def test_single_flight():
+    asyncio.run(_test_single_flight())
+
+
+if __name__ == "__main__":
+    print("🚀 开始测试估价请求合并...")
+    test_single_flight()
+    print("✅ 测试通过")
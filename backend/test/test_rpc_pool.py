@@ -0,0 +1,191 @@
+import asyncio
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+from web3 import AsyncWeb3
+
+from app.utils.rpc_pool import RPCEndpointPool
+import logging
+
+# 配置日志
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class StandInRPCNode:
+    """本地替身JSON-RPC节点：可设置响应延迟，或切换为故障状态（返回503）"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.failing = False
+        # eth_getLogs 是否返回“结果过多”的错误（-32005）
+        self.too_many_logs = False
+        self.calls = []
+        self.runner = None
+        self.port = None
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def _handle(self, request):
+        payload = await request.json()
+        self.calls.append(payload["method"])
+        if self.failing:
+            return web.Response(status=503)
+        await asyncio.sleep(self.delay)
+
+        if payload["method"] == "eth_getLogs" and self.too_many_logs:
+            return web.json_response(
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload["id"],
+                    "error": {
+                        "code": -32005,
+                        "message": "query returned more than 10000 results",
+                    },
+                }
+            )
+        if payload["method"] == "eth_sendRawTransaction":
+            result = "0x" + "ab" * 32
+        else:
+            result = hex(1000 + len(self.calls))
+        return web.json_response(
+            {"jsonrpc": "2.0", "id": payload["id"], "result": result}
+        )
+
+
+def _make_pool(*nodes: StandInRPCNode, **kwargs) -> RPCEndpointPool:
+    return RPCEndpointPool(
+        [node.url for node in nodes], request_kwargs={"timeout": 2}, **kwargs
+    )
+
+
+async def _read_blocks(w3: AsyncWeb3, count: int) -> float:
+    started = time.monotonic()
+    for _ in range(count):
+        await w3.eth.block_number
+    return time.monotonic() - started
+
+
+async def _test_routes_reads_to_fastest_endpoint():
+    async with StandInRPCNode(delay=0.2) as slow, StandInRPCNode() as fast:
+        w3 = AsyncWeb3(_make_pool(slow, fast))
+        await _read_blocks(w3, 30)
+        print(f"慢节点请求数: {len(slow.calls)}, 快节点请求数: {len(fast.calls)}")
+        assert len(fast.calls) > len(slow.calls) * 5
+
+
+async def _test_failover_keeps_throughput_steady():
+    async with StandInRPCNode(delay=0.01) as primary, StandInRPCNode(
+        delay=0.01
+    ) as backup:
+        pool = _make_pool(primary, backup, eject_seconds=60)
+        w3 = AsyncWeb3(pool)
+
+        baseline = await _read_blocks(w3, 50)
+        primary.failing = True
+        degraded = await _read_blocks(w3, 50)
+
+        print(f"故障前耗时: {baseline:.3f}s, 故障后耗时: {degraded:.3f}s")
+        assert degraded < baseline * 2 + 0.5, "故障转移后吞吐量明显下降"
+        await pool.disconnect()
+
+
+async def _test_ejected_endpoint_is_reprobed():
+    async with StandInRPCNode() as flaky, StandInRPCNode(delay=0.05) as steady:
+        pool = _make_pool(flaky, steady, eject_seconds=0.2)
+        w3 = AsyncWeb3(pool)
+
+        flaky.failing = True
+        await _read_blocks(w3, 10)
+        assert pool.endpoints[0].ejected, "故障节点未被摘除"
+
+        flaky.failing = False
+        await asyncio.sleep(0.5)
+        assert not pool.endpoints[0].ejected, "恢复的节点未被重新加入"
+
+        calls_before = len(flaky.calls)
+        await _read_blocks(w3, 10)
+        assert len(flaky.calls) > calls_before, "恢复的节点未重新承接读请求"
+        await pool.disconnect()
+
+
+async def _test_writes_are_broadcast():
+    async with StandInRPCNode() as first, StandInRPCNode() as second, StandInRPCNode(
+        delay=0.05
+    ) as third:
+        third.failing = True
+        pool = _make_pool(first, second, third)
+        response = await pool.make_request("eth_sendRawTransaction", ["0x00"])
+        await asyncio.sleep(0.1)
+
+        assert response["result"] == "0x" + "ab" * 32
+        for node in (first, second, third):
+            assert "eth_sendRawTransaction" in node.calls
+        await pool.disconnect()
+
+
+async def _test_range_errors_are_not_endpoint_failures():
+    async with StandInRPCNode() as first, StandInRPCNode(delay=0.05) as second:
+        first.too_many_logs = second.too_many_logs = True
+        pool = _make_pool(first, second)
+
+        for _ in range(3):
+            response = await pool.make_request(
+                "eth_getLogs", [{"fromBlock": "0x0", "toBlock": "0x186a0"}]
+            )
+            # 错误响应原样返回，由调用方（回填引擎）缩小区间
+            assert response["error"]["code"] == -32005
+
+        # 请求错误不换节点重试，也不摘除节点
+        assert len(first.calls) + len(second.calls) == 3
+        assert not any(endpoint.ejected for endpoint in pool.endpoints)
+        await pool.disconnect()
+
+
+def test_routes_reads_to_fastest_endpoint():
+    asyncio.run(_test_routes_reads_to_fastest_endpoint())
+
+
+def test_failover_keeps_throughput_steady():
+    asyncio.run(_test_failover_keeps_throughput_steady())
+
+
+def test_ejected_endpoint_is_reprobed():
+    asyncio.run(_test_ejected_endpoint_is_reprobed())
+
+
+def test_writes_are_broadcast():
+    asyncio.run(_test_writes_are_broadcast())
+
+
+def test_range_errors_are_not_endpoint_failures():
+    asyncio.run(_test_range_errors_are_not_endpoint_failures())
+
+
+if __name__ == "__main__":
+    print("🚀 开始RPC节点池测试")
+    test_routes_reads_to_fastest_endpoint()
+    test_failover_keeps_throughput_steady()
+    test_ejected_endpoint_is_reprobed()
+    test_writes_are_broadcast()
+    test_range_errors_are_not_endpoint_failures()
+    print("✅ 测试通过")
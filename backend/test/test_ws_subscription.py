@@ -0,0 +1,165 @@
+import asyncio
+import json
+import sys
+import os
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import websockets
+
+from app.utils.chain_ingestor import ChainIngestor
+from app.utils.chain_config import ChainConfig
+from app.utils.async_chain_client import AsyncChainClient
+import logging
+
+# 配置日志
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class StandInWSNode:
+    """本地替身WS节点：应答 eth_subscribe 并推送新区块通知，可主动断开连接"""
+
+    def __init__(self, drop_after_push: bool = False):
+        self.drop_after_push = drop_after_push
+        self.connections = 0
+        self.subscriptions = []
+        self.server = None
+        self.port = None
+
+    async def __aenter__(self):
+        self.server = await websockets.serve(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}"
+
+    async def _handle(self, websocket, *args):
+        self.connections += 1
+        subscription_ids = []
+        async for message in websocket:
+            request = json.loads(message)
+            if request["method"] != "eth_subscribe":
+                await websocket.send(
+                    json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": None})
+                )
+                continue
+
+            subscription_id = hex(len(self.subscriptions) + 1)
+            self.subscriptions.append(request["params"])
+            subscription_ids.append(subscription_id)
+            await websocket.send(
+                json.dumps(
+                    {"jsonrpc": "2.0", "id": request["id"], "result": subscription_id}
+                )
+            )
+
+            # 两个订阅（newHeads、logs）都建立后推送一个新区块头
+            if len(subscription_ids) == 2:
+                await asyncio.sleep(0.1)
+                await websocket.send(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "eth_subscription",
+                            "params": {
+                                "subscription": subscription_ids[0],
+                                "result": {"number": hex(100 + self.connections)},
+                            },
+                        }
+                    )
+                )
+                if self.drop_after_push:
+                    await websocket.close()
+                    return
+
+
+def _make_listener(ws_url: str) -> ChainIngestor:
+    listener = ChainIngestor(
+        ChainConfig(
+            name="stand-in",
+            client=AsyncChainClient(chain_label="StandIn"),
+            launchpad_contract_address="0x" + "22" * 20,
+            dao=None,
+            ws_url=ws_url,
+        )
+    )
+    listener.nft_contract = SimpleNamespace(address="0x" + "11" * 20)
+    listener.launchpad_contract = SimpleNamespace(address="0x" + "22" * 20)
+    listener.event_decoders = {
+        ("0x" + "11" * 20, b"\x01" * 32): ("Minted", None),
+        ("0x" + "22" * 20, b"\x02" * 32): ("Bought", None),
+    }
+    listener.is_running = True
+    return listener
+
+
+async def _wait_for_wake(listener: ChainIngestor, timeout: float) -> float:
+    started = time.monotonic()
+    await asyncio.wait_for(listener.new_block_event.wait(), timeout)
+    listener.new_block_event.clear()
+    return time.monotonic() - started
+
+
+async def _test_push_wakes_listener():
+    async with StandInWSNode() as node:
+        listener = _make_listener(node.url)
+        task = asyncio.create_task(listener._run_subscription())
+        try:
+            latency = await _wait_for_wake(listener, 5)
+            print(f"推送唤醒延迟: {latency:.3f}s")
+            assert latency < 2, f"推送唤醒过慢: {latency}"
+            assert node.subscriptions[0] == ["newHeads"]
+            assert node.subscriptions[1][0] == "logs"
+        finally:
+            listener.stop_listening()
+            task.cancel()
+
+
+async def _test_reconnects_after_drop():
+    async with StandInWSNode(drop_after_push=True) as node:
+        listener = _make_listener(node.url)
+        task = asyncio.create_task(listener._run_subscription())
+        try:
+            await _wait_for_wake(listener, 5)
+            # 连接被断开后应自动重连并再次收到推送
+            await _wait_for_wake(listener, 5)
+            assert node.connections >= 2, f"未重连，连接数: {node.connections}"
+        finally:
+            listener.stop_listening()
+            task.cancel()
+
+
+async def _test_polling_fallback_without_socket():
+    listener = _make_listener("")
+    started = time.monotonic()
+    await listener._wait_for_new_blocks(0.2)
+    assert time.monotonic() - started >= 0.2
+
+
+def test_push_wakes_listener():
+    asyncio.run(_test_push_wakes_listener())
+
+
+def test_reconnects_after_drop():
+    asyncio.run(_test_reconnects_after_drop())
+
+
+def test_polling_fallback_without_socket():
+    asyncio.run(_test_polling_fallback_without_socket())
+
+
+if __name__ == "__main__":
+    print("🚀 开始WebSocket订阅模式测试")
+    test_push_wakes_listener()
+    test_reconnects_after_drop()
+    test_polling_fallback_without_socket()
+    print("✅ 测试通过")
@@ -82,12 +82,24 @@ contract AiTextNFT is ERC721, Ownable {
         tokenId = _mintToMarket(seller, contentCopy);
     }
 
-    function setPrice(uint256 tokenId, uint256 price) external {
-        require(_ownerOf(tokenId) != address(0), "nonexistent");
+    modifier onlyPriceSetter() {
         require(msg.sender == owner() || msg.sender == priceSetter, "not setter");
-        priceOf[tokenId] = price;
-        isBuyable[tokenId] = true;
-        emit PriceSet(tokenId, price);
+        _;
+    }
+
+    function setPrice(uint256 tokenId, uint256 price) external onlyPriceSetter {
+        _setPrice(tokenId, price);
+    }
+
+    /// @dev 批量定价，后端将一段时间内的多个定价合并为一笔交易
+    function batchSetPrice(uint256[] calldata tokenIds, uint256[] calldata prices)
+        external
+        onlyPriceSetter
+    {
+        require(tokenIds.length == prices.length, "length mismatch");
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            _setPrice(tokenIds[i], prices[i]);
+        }
     }
 
     function contentOf(uint256 tokenId) external view returns (string memory) {
@@ -143,6 +155,13 @@ contract AiTextNFT is ERC721, Ownable {
         IAiLaunchpad(market).autoListMinted(seller, tokenId);
     }
 
+    function _setPrice(uint256 tokenId, uint256 price) internal {
+        require(_ownerOf(tokenId) != address(0), "nonexistent");
+        priceOf[tokenId] = price;
+        isBuyable[tokenId] = true;
+        emit PriceSet(tokenId, price);
+    }
+
     function _collectMintFee() internal {
         if (mintFee == 0) {
             require(msg.value == 0, "no fee required");
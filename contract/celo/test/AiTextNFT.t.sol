@@ -0,0 +1,106 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "forge-std/Test.sol";
+
+import "../src/AiTextNFT.sol";
+import "../src/Luanchpad.sol";
+
+contract AiTextNFTPriceTest is Test {
+    AiTextNFT internal nft;
+    AiLaunchpad internal market;
+
+    address internal constant ALICE = address(0xA11CE);
+    address internal constant SETTER = address(0x5E77E2);
+    address internal constant FEE_RECIPIENT = address(0xFEE);
+
+    event PriceSet(uint256 indexed tokenId, uint256 price);
+
+    function setUp() public {
+        nft = new AiTextNFT("AI Text", "AIT");
+        market = new AiLaunchpad(address(nft), FEE_RECIPIENT, 500);
+
+        nft.setMarket(address(market));
+        nft.setPriceSetter(SETTER);
+    }
+
+    function testBatchSetPriceSetsAllPricesAndEmitsEvents() public {
+        uint256[] memory tokenIds = new uint256[](3);
+        uint256[] memory prices = new uint256[](3);
+        for (uint256 i = 0; i < 3; i++) {
+            tokenIds[i] = _mint("batched content");
+            prices[i] = (i + 1) * 0.01 ether;
+        }
+
+        for (uint256 i = 0; i < 3; i++) {
+            vm.expectEmit(true, false, false, true, address(nft));
+            emit PriceSet(tokenIds[i], prices[i]);
+        }
+        vm.prank(SETTER);
+        nft.batchSetPrice(tokenIds, prices);
+
+        for (uint256 i = 0; i < 3; i++) {
+            assertEq(nft.priceOf(tokenIds[i]), prices[i]);
+            assertTrue(nft.isBuyable(tokenIds[i]));
+        }
+    }
+
+    function testBatchSetPriceByOwner() public {
+        uint256[] memory tokenIds = new uint256[](1);
+        uint256[] memory prices = new uint256[](1);
+        tokenIds[0] = _mint("owner priced");
+        prices[0] = 1 ether;
+
+        nft.batchSetPrice(tokenIds, prices);
+
+        assertEq(nft.priceOf(tokenIds[0]), 1 ether);
+    }
+
+    function testBatchSetPriceRequiresSetter() public {
+        uint256[] memory tokenIds = new uint256[](1);
+        uint256[] memory prices = new uint256[](1);
+        tokenIds[0] = _mint("guarded");
+        prices[0] = 1 ether;
+
+        vm.expectRevert("not setter");
+        vm.prank(ALICE);
+        nft.batchSetPrice(tokenIds, prices);
+    }
+
+    function testBatchSetPriceRejectsLengthMismatch() public {
+        uint256[] memory tokenIds = new uint256[](2);
+        uint256[] memory prices = new uint256[](1);
+        tokenIds[0] = _mint("first");
+        tokenIds[1] = _mint("second");
+
+        vm.expectRevert("length mismatch");
+        vm.prank(SETTER);
+        nft.batchSetPrice(tokenIds, prices);
+    }
+
+    function testBatchSetPriceRevertsOnNonexistentToken() public {
+        uint256[] memory tokenIds = new uint256[](2);
+        uint256[] memory prices = new uint256[](2);
+        tokenIds[0] = _mint("exists");
+        tokenIds[1] = 999;
+
+        vm.expectRevert("nonexistent");
+        vm.prank(SETTER);
+        nft.batchSetPrice(tokenIds, prices);
+    }
+
+    function testSetPriceStillWorks() public {
+        uint256 tokenId = _mint("single");
+
+        vm.prank(SETTER);
+        nft.setPrice(tokenId, 0.5 ether);
+
+        assertEq(nft.priceOf(tokenId), 0.5 ether);
+        assertTrue(nft.isBuyable(tokenId));
+    }
+
+    function _mint(string memory content) internal returns (uint256 tokenId) {
+        vm.prank(ALICE);
+        tokenId = nft.mint(content);
+    }
+}
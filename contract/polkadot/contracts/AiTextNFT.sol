@@ -83,12 +83,23 @@ contract AiTextNFT is Ownable {
         tokenId = _mint(seller, content);
     }
 
-    function setPrice(uint256 tokenId, uint256 price) external {
-        _requireExists(tokenId);
+    modifier onlyPriceSetter() {
         require(msg.sender == owner() || msg.sender == priceSetter, "not setter");
-        priceOf[tokenId] = price;
-        isBuyable[tokenId] = true;
-        emit PriceSet(tokenId, price);
+        _;
+    }
+
+    function setPrice(uint256 tokenId, uint256 price) external onlyPriceSetter {
+        _setPrice(tokenId, price);
+    }
+
+    function batchSetPrice(uint256[] calldata tokenIds, uint256[] calldata prices)
+        external
+        onlyPriceSetter
+    {
+        require(tokenIds.length == prices.length, "length mismatch");
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            _setPrice(tokenIds[i], prices[i]);
+        }
     }
 
     function contentOf(uint256 tokenId) external view returns (string memory) {
@@ -129,6 +140,13 @@ contract AiTextNFT is Ownable {
         IAiLaunchpad(market).autoListMinted(seller, tokenId);
     }
 
+    function _setPrice(uint256 tokenId, uint256 price) internal {
+        _requireExists(tokenId);
+        priceOf[tokenId] = price;
+        isBuyable[tokenId] = true;
+        emit PriceSet(tokenId, price);
+    }
+
     function _collectMintFee() internal {
         if (mintFee == 0) {
             require(msg.value == 0, "no fee required");